@@ -0,0 +1,55 @@
+"""
+Service configuration.
+
+This is the only module that loads the .env file. Everything else imports
+`settings` (or reads os.environ after this module has been imported).
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+
+# Load .env once per process tree (reload/worker children inherit the flag),
+# and only from the service directory, never from parent directories.
+if not os.getenv("_ENV_LOADED"):
+    load_dotenv(Path(__file__).with_name(".env"))
+    os.environ["_ENV_LOADED"] = "1"
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    environment: str
+    is_production: bool
+    ai_root_path: str
+    enable_openapi: bool
+    frontend_origin: str
+    openai_api_key: str
+    openai_model: str
+    openai_max_retries: int
+    openai_timeout_s: float
+    openai_max_concurrency: int
+    similarweb_api_key: str
+
+
+_ENVIRONMENT = os.getenv("ENVIRONMENT", "")
+_IS_PRODUCTION = os.getenv("NODE_ENV") == "production" or _ENVIRONMENT == "production"
+
+settings = Settings(
+    environment=_ENVIRONMENT,
+    is_production=_IS_PRODUCTION,
+    ai_root_path=os.getenv("AI_ROOT_PATH", "/ai"),  # external prefix via ALB
+    # docs/schema toggle (off in production unless set)
+    enable_openapi=os.getenv("AI_ENABLE_OPENAPI", "0" if _IS_PRODUCTION else "1") == "1",
+    frontend_origin=os.getenv("FRONTEND_ORIGIN", "").strip(),
+    openai_api_key=os.getenv("OPENAI_API_KEY", "").strip(),
+    openai_model=os.getenv("OPENAI_MODEL", "gpt-4o"),
+    # SDK retries 408/409/429/5xx and connection errors with backoff (honoring Retry-After)
+    openai_max_retries=int(os.getenv("OPENAI_MAX_RETRIES", "3")),
+    openai_timeout_s=float(os.getenv("OPENAI_TIMEOUT_SECONDS", "120")),
+    # per-worker cap on in-flight OpenAI requests; extra calls queue for a connection
+    openai_max_concurrency=int(os.getenv("OPENAI_MAX_CONCURRENCY", "8")),
+    similarweb_api_key=os.getenv("SIMILARWEB_API_KEY", "").strip(),
+)
@@ -1,39 +1,39 @@
 import os
-import sys
-from dotenv import load_dotenv
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from config import settings  # loads .env before any route/helper module
 from routes.documentation import router as documentation_router
 from routes.seo import router as seo_router
 from routes.analytics import router as analytics_router
+from utils.http_client import close_http_session
 
-load_dotenv()
-
-# Turn off debug logs in production (keep errors)
-IS_PRODUCTION = os.getenv('NODE_ENV') == 'production' or os.getenv('ENVIRONMENT') == 'production'
-if IS_PRODUCTION:
-    import builtins
-    original_print = builtins.print
-    
-    def production_print(*args, **kwargs):
-        # Only allow prints that explicitly go to stderr (errors)
-        if kwargs.get('file') == sys.stderr:
-            original_print(*args, **kwargs)
-        # Suppress all other print statements (debug logs)
-    
-    builtins.print = production_print
+# Turn off debug logs in production (keep warnings and errors)
+IS_PRODUCTION = settings.is_production
+logging.basicConfig(level=logging.WARNING if IS_PRODUCTION else logging.INFO)
 
 # ---- Config ----
-AI_ROOT_PATH = os.getenv("AI_ROOT_PATH", "/ai")  # external prefix via ALB
-ENABLE_OPENAPI = os.getenv("AI_ENABLE_OPENAPI", "1") == "1"  # docs/schema toggle
+AI_ROOT_PATH = settings.ai_root_path  # external prefix via ALB
+ENABLE_OPENAPI = settings.enable_openapi  # docs/schema toggle (off in production unless set)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release the pooled outbound connections (utils.http_client) on shutdown
+    await close_http_session()
+
 
 app = FastAPI(
     title="DocsGen AI Service",
+    lifespan=lifespan,
     root_path=AI_ROOT_PATH,
     openapi_url="/openapi.json" if ENABLE_OPENAPI else None,
     docs_url="/docs" if ENABLE_OPENAPI else None,
     redoc_url="/redoc" if ENABLE_OPENAPI else None,
+    default_response_class=ORJSONResponse,
 )
 
 # ---- CORS ----
@@ -50,55 +50,70 @@ allowed_origins = [
 ]
 
 # Add production origin if set
-production_origin = os.getenv("FRONTEND_ORIGIN")
+production_origin = settings.frontend_origin
 if production_origin:
     allowed_origins.append(production_origin)
 
 # Allow all origins in development, specific origins in production
-if os.getenv("ENVIRONMENT") != "production":
+if settings.environment != "production":
     allowed_origins = ["*"]
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
     allow_credentials=True if allowed_origins != ["*"] else False,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization", "X-API-Key"],
     expose_headers=["*"],
+    max_age=86400,  # let browsers cache preflights for 24h
 )
 
+# ---- Root path ----
+# The ALB forwards /ai/* without rewriting it. Strip the prefix before routing so
+# every router is mounted once; root_path=/ai still renders external URLs.
+class StripRootPathMiddleware:
+    def __init__(self, app, prefix: str):
+        self.app = app
+        self.prefix = prefix.rstrip("/")
+
+    async def __call__(self, scope, receive, send):
+        if self.prefix and scope["type"] in ("http", "websocket"):
+            path = scope["path"]
+            if path == self.prefix or path.startswith(self.prefix + "/"):
+                scope = dict(scope)
+                scope["path"] = path[len(self.prefix):] or "/"
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(StripRootPathMiddleware, prefix=AI_ROOT_PATH)
+
 # ---- Routers (single mount; root_path=/ai makes them externally /ai/...) ----
-# Existing mounts (internal paths)
 app.include_router(documentation_router, prefix="/api/v1/documentation", tags=["documentation"])
 app.include_router(seo_router, prefix="/api/v1/seo", tags=["seo"])
 app.include_router(analytics_router, prefix="/api/v1/analytics", tags=["analytics"])
 
-# Mirror mounts (external /ai/* paths)
-app.include_router(documentation_router, prefix="/ai/api/v1/documentation", tags=["documentation"])
-app.include_router(seo_router, prefix="/ai/api/v1/seo", tags=["seo"])
-app.include_router(analytics_router, prefix="/ai/api/v1/analytics", tags=["analytics"])
-
-
 
 # ---- Health ----
 @app.get("/ping")
 def ping():
     return {"status": "ok", "message": "AI service running"}
 
-@app.get("/ai/ping")
-def ai_ping():
-    return {"status": "ok", "message": "AI service running"}
-
 @app.get("/health")
 def health():
     return {"status": "ok", "message": "AI service running"}
 
-@app.get("/ai/health")
-def ai_health():
-    return {"status": "ok", "message": "AI service running"}
-
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 5001))
-    root_path = os.getenv("AI_ROOT_PATH", "/ai")
-    uvicorn.run(app, host="0.0.0.0", port=port, root_path=root_path, reload=True)
\ No newline at end of file
+    dev = os.getenv("DEV") == "1"
+    # Import string (not the app object) so uvicorn can fork workers; reload only in dev.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        root_path=AI_ROOT_PATH,
+        workers=1 if dev else int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        loop="uvloop",
+        http="httptools",
+        reload=dev,
+    )
\ No newline at end of file
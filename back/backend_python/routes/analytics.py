@@ -1,7 +1,9 @@
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, validator
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, field_validator
 from typing import Optional, List
 from utils.analytics_helper import (
+    AnalysisDepth,
     generate_analytics_report,
     ai_rewrite_analytics_content,
     analytics_quality_check,
@@ -9,26 +11,29 @@ from utils.analytics_helper import (
     generate_analytics_action_points,
 )
 from utils.web_crawler import crawl_and_extract
+from utils.text import count_words, estimate_read_time, normalize_url
 import asyncio
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
 
 class AnalyticsRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True, str_strip_whitespace=True)
+
     website_url: str
     competitor_urls: Optional[str] = None
-    analysis_depth: str = "comprehensive"
+    analysis_depth: AnalysisDepth = "comprehensive"
     include_revenue_analysis: bool = True
     include_traffic_analysis: bool = True
     include_competitor_comparison: bool = True
     language: str = "en"
     enable_js_render: bool = False
 
-    @validator('analysis_depth')
-    def validate_analysis_depth(cls, v):
-        valid_depths = ["quick", "standard", "comprehensive", "deep"]
-        if v not in valid_depths:
-            raise ValueError(f"Invalid analysis_depth. Must be one of: {', '.join(valid_depths)}")
-        return v.lower()
+    @field_validator("analysis_depth", mode="before")
+    @classmethod
+    def _normalize_analysis_depth(cls, v):
+        # Case-insensitive input; the AnalysisDepth Literal does the membership check in pydantic-core
+        return v.strip().lower() if isinstance(v, str) else v
 
 class AnalyticsResponse(BaseModel):
     report: str
@@ -38,29 +43,13 @@ class AnalyticsResponse(BaseModel):
     brand_visibility_evidence: List[dict] = []
     competitor_brand_visibility_evidence: List[dict] = []
 
-def count_words(text: str) -> int:
-    """Count words in text"""
-    return len(text.split())
-
-def estimate_read_time(word_count: int) -> int:
-    """Estimate reading time in minutes (average 200 words per minute)"""
-    return max(1, round(word_count / 200))
-
-@router.post("/", response_model=AnalyticsResponse)
-async def create_analytics_report(request: AnalyticsRequest):
+@router.post("/")
+async def create_analytics_report(request: AnalyticsRequest) -> AnalyticsResponse:
     try:
         competitor_list = None
         if request.competitor_urls:
-            # Split by comma and clean up URLs
-            competitor_list = []
-            for url in request.competitor_urls.split(','):
-                url = url.strip()
-                if url:
-                    # Normalize URL
-                    if not url.startswith(('http://', 'https://')):
-                        url = f"https://{url}"
-                    url = url.rstrip('/')
-                    competitor_list.append(url)
+            # Split by comma and normalize URLs
+            competitor_list = [normalize_url(u) for u in request.competitor_urls.split(",") if u.strip()]
         
         result = await generate_analytics_report(
             website_url=request.website_url,
@@ -103,8 +92,8 @@ class AnalyticsRewriteResponse(BaseModel):
     word_count: Optional[int] = None  # word count of rewritten content for display
 
 
-@router.post("/rewrite", response_model=AnalyticsRewriteResponse)
-async def rewrite_analytics_content(request: AnalyticsRewriteRequest):
+@router.post("/rewrite")
+async def rewrite_analytics_content(request: AnalyticsRewriteRequest) -> AnalyticsRewriteResponse:
     try:
         rewritten = await ai_rewrite_analytics_content(
             original_content=request.content,
@@ -156,8 +145,8 @@ class AnalyticsRecommendationsResponse(BaseModel):
     word_count: int
 
 
-@router.post("/ai-recommendations", response_model=AnalyticsRecommendationsResponse)
-async def get_analytics_ai_recommendations(request: AnalyticsRecommendationsRequest):
+@router.post("/ai-recommendations")
+async def get_analytics_ai_recommendations(request: AnalyticsRecommendationsRequest) -> AnalyticsRecommendationsResponse:
     try:
         recommendations = await generate_analytics_ai_recommendations(
             website_url=request.website_url,
@@ -184,17 +173,14 @@ class AnalyticsActionPointsRequest(BaseModel):
     enable_js_render: bool = False
 
 
-@router.post("/action-points", response_model=AnalyticsRecommendationsResponse)
-async def get_analytics_action_points(request: AnalyticsActionPointsRequest):
+@router.post("/action-points")
+async def get_analytics_action_points(request: AnalyticsActionPointsRequest) -> AnalyticsRecommendationsResponse:
     """Website Analytics Recommendations: extract recommendations from report sections; uses AI and optional competitor crawl to ground recommendations."""
     try:
         competitor_list = request.competitor_urls
         competitor_crawl_data = None
         if competitor_list:
-            first_url = competitor_list[0].strip()
-            if not first_url.startswith(("http://", "https://")):
-                first_url = f"https://{first_url}"
-            first_url = first_url.rstrip("/")
+            first_url = normalize_url(competitor_list[0])
             try:
                 competitor_crawl_data = await crawl_and_extract(first_url, use_js_render=request.enable_js_render)
                 if competitor_crawl_data:
@@ -1,73 +1,42 @@
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, validator
-from typing import Optional, List
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Literal, Optional, List
+from collections import OrderedDict
 from utils.documentation_helper import generate_documentation
+from utils.text import count_words, estimate_read_time
 import asyncio
+import itertools
+import uuid
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 class DocumentationRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True, str_strip_whitespace=True)
+
     app_name: str
-    app_type: str
-    doc_type: str
+    app_type: Literal["web", "mobile", "api", "saas", "desktop", "hybrid"]
+    doc_type: Literal["user-guide", "api-docs", "developer-guide", "admin-docs", "quick-start", "faq", "release-notes"]
     feature_description: str
-    technical_level: Optional[str] = "intermediate"
-    style: Optional[str] = "tutorial"
-    tone: Optional[str] = "technical"
+    technical_level: Optional[Literal["beginner", "intermediate", "advanced"]] = "intermediate"
+    style: Optional[Literal["tutorial", "reference", "conceptual"]] = "tutorial"
+    tone: Optional[Literal["technical", "friendly", "formal", "conversational"]] = "technical"
     language: Optional[str] = "en"
     include_code_examples: Optional[bool] = True
     include_screenshots: Optional[bool] = False
     target_audience: Optional[str] = "developers"
-    format: Optional[str] = "markdown"
+    format: Optional[Literal["markdown", "html", "plain-text"]] = "markdown"
     app_url: Optional[str] = None
     enable_js_render: Optional[bool] = False
 
-    @validator('doc_type')
-    def validate_doc_type(cls, v):
-        valid_types = [
-            "user-guide", "api-docs", "developer-guide", 
-            "admin-docs", "quick-start", "faq", "release-notes"
-        ]
-        if v not in valid_types:
-            raise ValueError(f"Invalid doc_type. Must be one of: {', '.join(valid_types)}")
-        return v.lower()
-
-    @validator('app_type')
-    def validate_app_type(cls, v):
-        valid_types = ["web", "mobile", "api", "saas", "desktop", "hybrid"]
-        if v not in valid_types:
-            raise ValueError(f"Invalid app_type. Must be one of: {', '.join(valid_types)}")
-        return v.lower()
-
-    @validator('technical_level')
-    def validate_technical_level(cls, v):
-        valid_levels = ["beginner", "intermediate", "advanced"]
-        if v not in valid_levels:
-            raise ValueError(f"Invalid technical_level. Must be one of: {', '.join(valid_levels)}")
-        return v.lower()
-
-    @validator('style')
-    def validate_style(cls, v):
-        valid_styles = ["tutorial", "reference", "conceptual"]
-        if v not in valid_styles:
-            raise ValueError(f"Invalid style. Must be one of: {', '.join(valid_styles)}")
-        return v.lower()
-
-    @validator('tone')
-    def validate_tone(cls, v):
-        valid_tones = ["technical", "friendly", "formal", "conversational"]
-        if v not in valid_tones:
-            raise ValueError(f"Invalid tone. Must be one of: {', '.join(valid_tones)}")
-        return v.lower()
-
-    @validator('format')
-    def validate_format(cls, v):
-        valid_formats = ["markdown", "html", "plain-text"]
-        if v not in valid_formats:
-            raise ValueError(f"Invalid format. Must be one of: {', '.join(valid_formats)}")
-        return v.lower()
+    @field_validator("doc_type", "app_type", "technical_level", "style", "tone", "format", mode="before")
+    @classmethod
+    def _normalize_choice(cls, v):
+        # Case-insensitive input; the Literal annotations do the membership check in pydantic-core
+        return v.strip().lower() if isinstance(v, str) else v
 
 class DocumentationResponse(BaseModel):
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     documentation: str
     format: str
     word_count: int
@@ -76,18 +45,13 @@ class DocumentationResponse(BaseModel):
     doc_type: str
 
 # Store documentation in memory for testing
-documentation_store = []
-
-def count_words(text: str) -> int:
-    """Count words in text"""
-    return len(text.split())
+# Keyed by the response id (deleting one entry does not shift the others); oldest
+# entries are evicted past MAX_STORED_DOCS so memory stays bounded.
+MAX_STORED_DOCS = 500
+documentation_store: "OrderedDict[str, DocumentationResponse]" = OrderedDict()
 
-def estimate_read_time(word_count: int) -> int:
-    """Estimate reading time in minutes (average 200 words per minute)"""
-    return max(1, round(word_count / 200))
-
-@router.post("/", response_model=DocumentationResponse)
-async def create_documentation(request: DocumentationRequest):
+@router.post("/")
+async def create_documentation(request: DocumentationRequest) -> DocumentationResponse:
     try:
         documentation = await generate_documentation(
             app_name=request.app_name,
@@ -117,25 +81,29 @@ async def create_documentation(request: DocumentationRequest):
             app_name=request.app_name,
             doc_type=request.doc_type
         )
-        documentation_store.append(response)
+        documentation_store[response.id] = response
+        while len(documentation_store) > MAX_STORED_DOCS:
+            documentation_store.popitem(last=False)
         return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/", response_model=List[DocumentationResponse])
-async def get_documentations():
-    return documentation_store
-
-@router.get("/{doc_id}", response_model=DocumentationResponse)
-async def get_documentation(doc_id: int):
-    if doc_id < 0 or doc_id >= len(documentation_store):
+@router.get("/")
+async def get_documentations(
+    limit: int = Query(50, ge=1, le=MAX_STORED_DOCS),
+    offset: int = Query(0, ge=0),
+) -> List[DocumentationResponse]:
+    return list(itertools.islice(documentation_store.values(), offset, offset + limit))
+
+@router.get("/{doc_id}")
+async def get_documentation(doc_id: str) -> DocumentationResponse:
+    doc = documentation_store.get(doc_id)
+    if doc is None:
         raise HTTPException(status_code=404, detail="Documentation not found")
-    return documentation_store[doc_id]
+    return doc
 
 @router.delete("/{doc_id}")
-async def delete_documentation(doc_id: int):
-    if doc_id < 0 or doc_id >= len(documentation_store):
+async def delete_documentation(doc_id: str):
+    if documentation_store.pop(doc_id, None) is None:
         raise HTTPException(status_code=404, detail="Documentation not found")
-    
-    documentation_store.pop(doc_id)
     return {"message": "Documentation deleted successfully"}
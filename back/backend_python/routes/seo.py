@@ -1,8 +1,11 @@
 # REPLACE THIS ENTIRE FILE CONTENT with the version below
 # (or apply the marked blocks if you prefer a smaller diff)
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, validator
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, field_validator
 from typing import Optional, List, Dict, Any
 from utils.seo_helper import (
     generate_seo_report,
@@ -12,11 +15,23 @@ from utils.seo_helper import (
     generate_ai_optimized_recommendations,
 )
 from utils.web_crawler import crawl_and_extract
+from utils.text import count_words, estimate_read_time, normalize_url
+
+router = APIRouter(default_response_class=ORJSONResponse)
 
-router = APIRouter()
+# Allow-lists for SEORequest, built once at import (tuples keep the documented
+# order for error messages, frozensets are for the membership checks).
+_BUSINESS_TYPES = ("saas", "ecommerce", "blog", "portfolio", "corporate", "nonprofit", "other")
+_FOCUS_AREAS = ("on-page", "technical", "content", "off-page", "local", "mobile", "speed", "accessibility")
+_VALID_BUSINESS_TYPES = frozenset(_BUSINESS_TYPES)
+_VALID_FOCUS_AREAS = frozenset(_FOCUS_AREAS)
+_BUSINESS_TYPE_ERROR = f"Invalid business_type. Must be one of: {', '.join(_BUSINESS_TYPES)}"
+_VALID_FOCUS_AREAS_TEXT = ", ".join(_FOCUS_AREAS)
 
 
 class SEORequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True, str_strip_whitespace=True)
+
     website_url: str
     business_type: str = "saas"
     target_keywords: Optional[str] = None
@@ -26,20 +41,20 @@ class SEORequest(BaseModel):
     enable_js_render: bool = False
     competitor_urls: Optional[List[str]] = None
 
-    @validator("business_type")
+    @field_validator("business_type")
+    @classmethod
     def validate_business_type(cls, v):
-        valid_types = ["saas", "ecommerce", "blog", "portfolio", "corporate", "nonprofit", "other"]
-        if v not in valid_types:
-            raise ValueError(f"Invalid business_type. Must be one of: {', '.join(valid_types)}")
+        if v not in _VALID_BUSINESS_TYPES:
+            raise ValueError(_BUSINESS_TYPE_ERROR)
         return v.lower()
 
-    @validator("focus_areas")
+    @field_validator("focus_areas")
+    @classmethod
     def validate_focus_areas(cls, v):
-        valid_areas = ["on-page", "technical", "content", "off-page", "local", "mobile", "speed", "accessibility"]
         if v:
-            invalid = [area for area in v if area not in valid_areas]
+            invalid = [area for area in v if area not in _VALID_FOCUS_AREAS]
             if invalid:
-                raise ValueError(f"Invalid focus_areas: {', '.join(invalid)}. Must be one of: {', '.join(valid_areas)}")
+                raise ValueError(f"Invalid focus_areas: {', '.join(invalid)}. Must be one of: {_VALID_FOCUS_AREAS_TEXT}")
         return v
 
 
@@ -52,16 +67,8 @@ class SEOResponse(BaseModel):
     qa: Dict[str, Any] = {}  # ADDED: return QA output
 
 
-def count_words(text: str) -> int:
-    return len(text.split())
-
-
-def estimate_read_time(word_count: int) -> int:
-    return max(1, round(word_count / 200))
-
-
-@router.post("/", response_model=SEOResponse)
-async def create_seo_report(request: SEORequest):
+@router.post("/")
+async def create_seo_report(request: SEORequest) -> SEOResponse:
     try:
         result = await generate_seo_report(
             website_url=request.website_url,
@@ -112,12 +119,13 @@ class ProductionMetaTagsResponse(BaseModel):
     full_code: str
 
 
-@router.post("/production-meta-tags", response_model=ProductionMetaTagsResponse)
-async def get_production_meta_tags(request: ProductionMetaTagsRequest):
+@router.post("/production-meta-tags")
+async def get_production_meta_tags(request: ProductionMetaTagsRequest) -> ProductionMetaTagsResponse:
     try:
         # FIXED: honor JS render flag
+        # Normalized like generate_seo_report does, so the crawl cache entry is shared
         crawled_data = await crawl_and_extract(
-            request.website_url,
+            normalize_url(request.website_url),
             use_js_render=request.enable_js_render,
         )
 
@@ -149,8 +157,8 @@ class RewriteResponse(BaseModel):
     rewritten_length: int
 
 
-@router.post("/rewrite", response_model=RewriteResponse)
-async def rewrite_content(request: RewriteRequest):
+@router.post("/rewrite")
+async def rewrite_content(request: RewriteRequest) -> RewriteResponse:
     try:
         rewritten = await ai_rewrite_seo_content(
             original_content=request.content,
@@ -200,33 +208,25 @@ class AIOptimizedRecommendationsResponse(BaseModel):
     word_count: int
 
 
-def _normalize_url_for_crawl(u: str) -> str:
-    u = (u or "").strip()
-    if not u:
-        return ""
-    if not u.startswith(("http://", "https://")):
-        u = f"https://{u}"
-    return u.rstrip("/")
-
-
-@router.post("/ai-optimized-recommendations", response_model=AIOptimizedRecommendationsResponse)
-async def get_ai_optimized_recommendations(request: AIOptimizedRecommendationsRequest):
+@router.post("/ai-optimized-recommendations")
+async def get_ai_optimized_recommendations(request: AIOptimizedRecommendationsRequest) -> AIOptimizedRecommendationsResponse:
     try:
-        crawled_data = await crawl_and_extract(
-            request.website_url,
-            use_js_render=request.enable_js_render,
-        )
+        # Site and competitor crawls run together; both are awaited before any
+        # error propagates, so neither is left running after a failed request.
+        # The site URL is normalized like generate_seo_report does, so the
+        # crawl cache entry from the report is reused.
+        first_url = normalize_url(request.competitor_urls[0]) if request.competitor_urls else ""
+        crawls = [crawl_and_extract(normalize_url(request.website_url), use_js_render=request.enable_js_render)]
+        if first_url:
+            crawls.append(crawl_and_extract(first_url, use_js_render=request.enable_js_render))
+        crawled_data, *competitor_results = await asyncio.gather(*crawls, return_exceptions=True)
+        if isinstance(crawled_data, BaseException):
+            raise crawled_data
 
         competitor_crawl_data = None
-        if request.competitor_urls:
-            first_url = _normalize_url_for_crawl(request.competitor_urls[0])
-            if first_url:
-                competitor_crawl_data = await crawl_and_extract(
-                    first_url,
-                    use_js_render=request.enable_js_render,
-                )
-                if competitor_crawl_data:
-                    competitor_crawl_data["url"] = first_url
+        if competitor_results and isinstance(competitor_results[0], dict):
+            competitor_crawl_data = competitor_results[0]
+            competitor_crawl_data["url"] = first_url
 
         recommendations = await generate_ai_optimized_recommendations(
             website_url=request.website_url,
@@ -13,43 +13,31 @@ No "evidence" or "not available" filler—actionable, research-informed advice o
 This file returns a dict in all paths. Never returns a plain string.
 """
 
-import os
 import asyncio
 import json
 import re
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from itertools import islice
+from typing import Optional, List, Dict, Any, Literal, Tuple, get_args
 from urllib.parse import urlparse
 
-from dotenv import load_dotenv
-from openai import AsyncOpenAI
+import orjson
 
-from utils.web_crawler import crawl_and_extract, format_crawled_content_for_prompt, crawl_competitors
+from utils.web_crawler import crawl_and_extract, crawl_competitors
 from utils.traffic_data_helper import get_traffic_data_for_domain, format_traffic_data_for_prompt
 from utils.brand_visibility_helper import get_brand_visibility_data, format_brand_visibility_data_for_prompt
+from utils.openai_client import get_openai_client
+from utils.cache import async_ttl_cache
+from utils.text import _evidence_json, count_words, extract_sentences, normalize_url, truncate_text
+from config import settings
 
 
-load_dotenv()
-
-
-def get_openai_client() -> AsyncOpenAI:
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key or api_key == "sk-placeholder" or api_key.startswith("sk-placeholder"):
-        raise ValueError(
-            "OpenAI API key is not configured. Please set OPENAI_API_KEY in your .env file. "
-            "Get your API key from https://platform.openai.com/api-keys"
-        )
-    return AsyncOpenAI(api_key=api_key)
-
-
-def _normalize_url(u: str) -> str:
-    u = (u or "").strip()
-    if not u:
-        return ""
-    if not u.startswith(("http://", "https://")):
-        u = f"https://{u}"
-    return u.rstrip("/")
+OPENAI_MODEL = settings.openai_model
 
 
+# The site and each competitor URL are resolved several times per report
+# (dedup, traffic, brand lookups); memoize so each is parsed once.
+@lru_cache(maxsize=256)
 def _to_domain(u: str) -> str:
     try:
         p = urlparse(u)
@@ -59,51 +47,54 @@ def _to_domain(u: str) -> str:
         return u.replace("www.", "")
 
 
-def _truncate_text(text: str, max_chars: int) -> str:
-    if not text:
-        return ""
-    if len(text) <= max_chars:
-        return text
-    return text[: max_chars - 3].rstrip() + "..."
-
+@lru_cache(maxsize=256)
+def _brand_from_url(url: str, default: str = "Brand") -> str:
+    """Fallback brand name from the first domain label ("www.acme.io" -> "Acme")."""
+    domain = (urlparse(url).netloc or "").replace("www.", "")
+    return (domain.split(".")[0] if domain else default).title()
 
-def _extract_sentences(text: str, max_sentences: int = 3) -> List[str]:
-    if not text:
-        return []
-    sentences = re.split(r"(?<=[.!?])\s+", text.strip())
-    return [s.strip() for s in sentences if s.strip()][:max_sentences]
 
-
-def _extract_pricing_signals(content: str) -> List[str]:
-    if not content:
-        return []
-    signals: List[str] = []
-    for sentence in _extract_sentences(content, max_sentences=10):
-        lower = sentence.lower()
-        if "$" in sentence or "pricing" in lower or "plan" in lower or "per month" in lower or "per user" in lower:
-            signals.append(_truncate_text(sentence, 200))
-    return signals[:3]
+# One case-insensitive pass per sentence instead of a .lower() copy plus a
+# substring scan per keyword (same plain-substring matching as before).
+_PRICING_RE = re.compile(r"\$|pricing|plan|per month|per user", re.IGNORECASE)
+_TRUST_RE = re.compile(r"testimonial|review|case study|trusted by|customers|ratings", re.IGNORECASE)
 
 
-def _extract_trust_signals(content: str) -> List[str]:
-    if not content:
-        return []
-    signals: List[str] = []
-    for sentence in _extract_sentences(content, max_sentences=12):
-        lower = sentence.lower()
-        if any(k in lower for k in ["testimonial", "review", "case study", "trusted by", "customers", "ratings"]):
-            signals.append(_truncate_text(sentence, 200))
-    return signals[:3]
+# Sentence windows and quotas for the content scan (same limits the separate
+# pricing / trust / quote extractors used).
+_PRICING_SCAN_SENTENCES = 10
+_TRUST_SCAN_SENTENCES = 12
+_MAX_SIGNALS = 3
 
 
-def _extract_quotes(content: str, source_url: str, max_quotes: int = 3) -> List[Dict[str, str]]:
+def _scan_content(content: str, source_url: str, max_quotes: int) -> Tuple[List[str], List[str], List[Dict[str, str]]]:
+    """
+    Pricing signals, trust signals and quotes from a single sentence split of content.
+    Stops as soon as every quota is filled or every window has been passed.
+    """
+    pricing: List[str] = []
+    trust: List[str] = []
     quotes: List[Dict[str, str]] = []
-    for sentence in _extract_sentences(content, max_sentences=max_quotes * 2):
-        if len(sentence) >= 40:
-            quotes.append({"quote": _truncate_text(sentence, 220), "source": source_url})
-        if len(quotes) >= max_quotes:
+    if not content:
+        return pricing, trust, quotes
+
+    quote_window = max_quotes * 2
+    window = max(_PRICING_SCAN_SENTENCES, _TRUST_SCAN_SENTENCES, quote_window)
+    for i, sentence in enumerate(extract_sentences(content, max_sentences=window)):
+        # Truncate at most once per sentence, even when it is both a pricing and a trust signal
+        signal = None
+        if i < _PRICING_SCAN_SENTENCES and len(pricing) < _MAX_SIGNALS and _PRICING_RE.search(sentence):
+            signal = truncate_text(sentence, 200)
+            pricing.append(signal)
+        if i < _TRUST_SCAN_SENTENCES and len(trust) < _MAX_SIGNALS and _TRUST_RE.search(sentence):
+            if signal is None:
+                signal = truncate_text(sentence, 200)
+            trust.append(signal)
+        if i < quote_window and len(quotes) < max_quotes and len(sentence) >= 40:
+            quotes.append({"quote": truncate_text(sentence, 220), "source": source_url})
+        if len(pricing) >= _MAX_SIGNALS and len(trust) >= _MAX_SIGNALS and len(quotes) >= max_quotes:
             break
-    return quotes
+    return pricing, trust, quotes
 
 
 def _build_site_evidence(data: Optional[Dict[str, Any]], fallback_url: str) -> Dict[str, Any]:
@@ -120,49 +111,77 @@ def _build_site_evidence(data: Optional[Dict[str, Any]], fallback_url: str) -> D
         }
     content = data.get("content", "") or ""
     url = data.get("url") or fallback_url
+    pricing, trust, quotes = _scan_content(content, url, max_quotes=5)
     return {
         "url": url,
-        "title": _truncate_text(data.get("title", "") or "", 160),
-        "description": _truncate_text(data.get("description", "") or "", 400),
+        "title": truncate_text(data.get("title", "") or "", 160),
+        "description": truncate_text(data.get("description", "") or "", 400),
         "headings": (data.get("headings") or [])[:10],
         "features": (data.get("features") or [])[:12],
-        "pricing_signals": _extract_pricing_signals(content),
-        "trust_signals": _extract_trust_signals(content),
-        "quotes": _extract_quotes(content, url, max_quotes=5),
+        "pricing_signals": pricing,
+        "trust_signals": trust,
+        "quotes": quotes,
     }
 
 
-def _build_competitor_evidence(data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    competitors: List[Dict[str, Any]] = []
-    for data in (data_list or [])[:6]:
-        content = data.get("content", "") or ""
-        url = data.get("url", "") or ""
-        competitors.append(
-            {
-                "name": _truncate_text(data.get("title", "") or "", 160),
-                "url": url,
-                "description": _truncate_text(data.get("description", "") or "", 400),
-                "headings": (data.get("headings") or [])[:8],
-                "features": (data.get("features") or [])[:12],
-                "pricing_signals": _extract_pricing_signals(content),
-                "trust_signals": _extract_trust_signals(content),
-                "quotes": _extract_quotes(content, url, max_quotes=4),
-            }
-        )
-    return competitors
+_MAX_COMPETITOR_EVIDENCE = 6
+
+
+def _build_one_competitor(data: Dict[str, Any]) -> Dict[str, Any]:
+    content = data.get("content", "") or ""
+    url = data.get("url", "") or ""
+    pricing, trust, quotes = _scan_content(content, url, max_quotes=4)
+    return {
+        "name": truncate_text(data.get("title", "") or "", 160),
+        "url": url,
+        "description": truncate_text(data.get("description", "") or "", 400),
+        "headings": (data.get("headings") or [])[:8],
+        "features": (data.get("features") or [])[:12],
+        "pricing_signals": pricing,
+        "trust_signals": trust,
+        "quotes": quotes,
+    }
+
+
+# The single list of valid analysis_depth values; the analytics route validates against it.
+AnalysisDepth = Literal["quick", "standard", "comprehensive", "deep"]
+
+# Built once at import; must have exactly one entry per AnalysisDepth value.
+ANALYSIS_DEPTH_INSTRUCTIONS: Dict[AnalysisDepth, str] = {
+    "quick": "Provide a high level overview with key metrics and top recommendations. Keep it concise (800 to 1200 words).",
+    "standard": "Provide a detailed analysis with metrics, insights, and actionable recommendations (1500 to 2500 words).",
+    "comprehensive": "Provide an exhaustive analysis with detailed metrics, deep insights, and comprehensive recommendations (3000 to 4000 words).",
+    "deep": "Provide an extremely detailed analysis with extensive metrics, strategic insights, and detailed implementation plans (4000 plus words).",
+}
+if set(ANALYSIS_DEPTH_INSTRUCTIONS) != set(get_args(AnalysisDepth)):
+    raise RuntimeError("ANALYSIS_DEPTH_INSTRUCTIONS keys must match AnalysisDepth")
+
+
+# Kept free of per-request values so the prefix is identical on every call
+# (lets OpenAI prompt caching reuse it); depth and language go in the user message.
+_ANALYTICS_SYSTEM_PROMPT = """
+You are an expert digital marketing analyst and business intelligence consultant.
+
+Use AI research to enrich the report: conduct research using your knowledge where it helps—e.g. industry benchmarks for this business type, typical conversion rates, best practices for SaaS/ecommerce/content sites, common competitor tactics, SEO and performance norms. Combine that research with the crawled site and competitor data so recommendations are both data-driven and informed by best practices and benchmarks.
+Use the crawled site (title, meta, headings, content, features, links) and competitor crawl when provided. Give actionable advice: what is wrong and what to do next.
+Do not write "Not available in evidence" or "Data Availability" or long paragraphs about missing data. If data for a section is missing, give one short line and 1–2 concrete next steps (e.g. "Set up Google Analytics for [URL]" or "Add competitor URLs and re-run").
+Do not add Evidence lines or "evidence suggests." Use the actual data from the summary and your research to give clear, actionable recommendations.
+Reference competitors by name and URL when competitor data is in the summary. Be specific: which page, which fix, which tool.
+Follow the minimum length and language given in the user message.
+""".strip()
 
 
 async def generate_analytics_report(
     website_url: str,
     competitor_urls: Optional[List[str]] = None,
-    analysis_depth: str = "comprehensive",
+    analysis_depth: AnalysisDepth = "comprehensive",
     include_revenue_analysis: bool = True,
     include_traffic_analysis: bool = True,
     include_competitor_comparison: bool = True,
     language: str = "en",
     enable_js_render: bool = False,
 ) -> Dict[str, Any]:
-    normalized_url = _normalize_url(website_url)
+    normalized_url = normalize_url(website_url)
     if not normalized_url:
         return {
             "report": "",
@@ -174,17 +193,26 @@ async def generate_analytics_report(
     normalized_competitor_urls: List[str] = []
     if competitor_urls:
         for u in competitor_urls:
-            nu = _normalize_url(u)
+            nu = normalize_url(u)
             if nu:
                 normalized_competitor_urls.append(nu)
 
+    # The site crawl and its traffic lookup don't depend on anything below, so
+    # start them now; they run alongside competitor discovery and each other.
+    crawl_task = asyncio.create_task(crawl_and_extract(normalized_url, use_js_render=enable_js_render))
+    traffic_task = (
+        asyncio.create_task(get_traffic_data_for_domain(_to_domain(normalized_url)))
+        if include_traffic_analysis
+        else None
+    )
+
     # When Competitor Comparison is on and user provided few or no URLs, discover competitors via AI and run same pipeline
     if include_competitor_comparison and len(normalized_competitor_urls) < 3:
         try:
             discovered = await _get_top_competitor_urls_for_analytics(normalized_url)
             seen_domains = {_to_domain(u) for u in normalized_competitor_urls}
             for u in (discovered or []):
-                nu = _normalize_url(u)
+                nu = normalize_url(u)
                 if not nu or _to_domain(nu) in seen_domains:
                     continue
                 seen_domains.add(_to_domain(nu))
@@ -194,31 +222,36 @@ async def generate_analytics_report(
         except Exception:
             pass
 
+    # Competitor pages are crawled while the traffic and brand-visibility
+    # lookups below are in flight; the result is awaited in the analysis block.
+    competitor_crawl_task = (
+        asyncio.create_task(
+            crawl_competitors(
+                normalized_competitor_urls,
+                max_concurrent=3,
+                use_js_render=enable_js_render,
+            )
+        )
+        if normalized_competitor_urls and include_competitor_comparison
+        else None
+    )
+
+    # The prompt carries crawl results only through evidence_json (built below),
+    # so no formatted text copy of the page is made here.
     website_data: Optional[Dict[str, Any]] = None
-    website_context = ""
     crawl_available = False
 
     try:
-        website_data = await crawl_and_extract(normalized_url, use_js_render=enable_js_render)
+        website_data = await crawl_task
         if website_data:
-            website_context = format_crawled_content_for_prompt(website_data) or ""
             crawl_available = bool(website_data.get("content"))
-        else:
-            website_context = (
-                f"Note: Could not fetch content from {normalized_url}. "
-                "The site may block crawlers or require authentication."
-            )
-    except Exception as e:
-        website_context = (
-            f"Note: Could not crawl website {normalized_url} ({str(e)}). "
-            "Analysis will proceed with available information."
-        )
+    except Exception:
+        website_data = None
 
     traffic_data_text = ""
-    if include_traffic_analysis:
+    if traffic_task is not None:
         try:
-            main_domain = _to_domain(normalized_url)
-            traffic_data = await get_traffic_data_for_domain(main_domain)
+            traffic_data = await traffic_task
             if isinstance(traffic_data, dict) and traffic_data.get("available"):
                 traffic_data_text = format_traffic_data_for_prompt(traffic_data, normalized_url) or ""
         except Exception:
@@ -227,13 +260,22 @@ async def generate_analytics_report(
     competitor_traffic_data_text = ""
     if normalized_competitor_urls and include_competitor_comparison and include_traffic_analysis:
         try:
+            # One lookup per competitor, all in flight together. The timeout is
+            # per lookup, so a slow domain is dropped on its own and the
+            # competitors that did answer are kept.
+            comp_results = await asyncio.gather(
+                *(
+                    asyncio.wait_for(get_traffic_data_for_domain(_to_domain(u)), timeout=15.0)
+                    for u in normalized_competitor_urls
+                ),
+                return_exceptions=True,
+            )
+
             parts: List[str] = []
-            for comp_url in normalized_competitor_urls:
-                comp_domain = _to_domain(comp_url)
-                comp_traffic = await get_traffic_data_for_domain(comp_domain)
+            for comp_url, comp_traffic in zip(normalized_competitor_urls, comp_results):
                 if isinstance(comp_traffic, dict) and comp_traffic.get("available"):
                     parts.append(format_traffic_data_for_prompt(comp_traffic, comp_url) or "")
-            competitor_traffic_data_text = "\n".join([p for p in parts if p])
+            competitor_traffic_data_text = "\n".join(p for p in parts if p)
         except Exception:
             competitor_traffic_data_text = ""
 
@@ -241,13 +283,10 @@ async def generate_analytics_report(
     brand_visibility_text = ""
     brand_visibility_evidence: List[Dict[str, Any]] = []
 
-    competitor_brand_visibility_text = ""
     competitor_brand_evidence: List[Dict[str, Any]] = []
 
     try:
-        parsed = urlparse(normalized_url)
-        domain = (parsed.netloc or "").replace("www.", "")
-        brand_name = (domain.split(".")[0] if domain else "Brand").title()
+        brand_name = _brand_from_url(normalized_url)
 
         if website_data and website_data.get("title"):
             t = (website_data.get("title") or "").strip()
@@ -285,9 +324,7 @@ async def generate_analytics_report(
             competitor_tasks: List[asyncio.Task] = []
             competitor_info: List[Dict[str, str]] = []
             for comp_url in normalized_competitor_urls:
-                parsed_comp = urlparse(comp_url)
-                comp_domain = (parsed_comp.netloc or "").replace("www.", "")
-                comp_brand = (comp_domain.split(".")[0] if comp_domain else "Competitor").title()
+                comp_brand = _brand_from_url(comp_url, "Competitor")
                 competitor_info.append({"url": comp_url, "brand": comp_brand})
                 competitor_tasks.append(
                     asyncio.create_task(
@@ -310,7 +347,6 @@ async def generate_analytics_report(
             except asyncio.TimeoutError:
                 results = []
 
-            parts: List[str] = []
             for idx, res in enumerate(results):
                 if isinstance(res, Exception) or not isinstance(res, dict):
                     continue
@@ -318,56 +354,17 @@ async def generate_analytics_report(
                     continue
                 info = competitor_info[idx] if idx < len(competitor_info) else {"url": "", "brand": "Competitor"}
                 formatted = format_brand_visibility_data_for_prompt(res, info["brand"])
-                txt = formatted.get("text", "") or ""
-                if txt:
-                    parts.append(f"COMPETITOR: {info['url']}\n{txt}")
                 competitor_brand_evidence.extend(formatted.get("evidence", []) or [])
-
-            competitor_brand_visibility_text = "\n\n".join(parts)
         except Exception:
-            competitor_brand_visibility_text = ""
             competitor_brand_evidence = []
 
+    # Competitor pages reach the prompt as per-competitor evidence entries only.
     competitor_data_list: List[Dict[str, Any]] = []
-    competitor_analysis = ""
-    if normalized_competitor_urls and include_competitor_comparison:
+    if competitor_crawl_task is not None:
         try:
-            competitor_data_list = await crawl_competitors(
-                normalized_competitor_urls,
-                max_concurrent=3,
-                use_js_render=enable_js_render,
-            )
-            if competitor_data_list:
-                competitor_parts: List[str] = []
-                competitor_parts.append("COMPETITOR ANALYSIS DATA")
-                competitor_parts.append(f"Competitors crawled: {len(competitor_data_list)}")
-                competitor_parts.append("")
-                for idx, c in enumerate(competitor_data_list, 1):
-                    comp_lines: List[str] = [f"COMPETITOR {idx}"]
-                    if c.get("url"):
-                        comp_lines.append(f"URL: {c.get('url')}")
-                    if c.get("title"):
-                        comp_lines.append(f"Title: {c.get('title')}")
-                    if c.get("description"):
-                        comp_lines.append(f"Description: {_truncate_text(c.get('description') or '', 500)}")
-                    if c.get("features"):
-                        comp_lines.append("Features:")
-                        for f in (c.get("features") or [])[:20]:
-                            comp_lines.append(f"* {f}")
-                    if c.get("headings"):
-                        comp_lines.append("Headings:")
-                        for h in (c.get("headings") or [])[:12]:
-                            comp_lines.append(f"* {h}")
-                    if c.get("content"):
-                        comp_lines.append("Content excerpt:")
-                        comp_lines.append(_truncate_text(c.get("content") or "", 2200))
-                    competitor_parts.append("\n".join(comp_lines))
-                    competitor_parts.append("")
-                competitor_analysis = "\n".join(competitor_parts)
-            else:
-                competitor_analysis = "Note: Competitor crawl not available."
-        except Exception as e:
-            competitor_analysis = f"Note: Could not analyze competitors ({str(e)})."
+            competitor_data_list = await competitor_crawl_task or []
+        except Exception:
+            competitor_data_list = []
 
     # Optional: industry context for structured guidance (what to compare, key metrics)
     industry_context = ""
@@ -377,13 +374,7 @@ async def generate_analytics_report(
     except Exception:
         pass
 
-    depth_instructions = {
-        "quick": "Provide a high level overview with key metrics and top recommendations. Keep it concise (800 to 1200 words).",
-        "standard": "Provide a detailed analysis with metrics, insights, and actionable recommendations (1500 to 2500 words).",
-        "comprehensive": "Provide an exhaustive analysis with detailed metrics, deep insights, and comprehensive recommendations (3000 to 4000 words).",
-        "deep": "Provide an extremely detailed analysis with extensive metrics, strategic insights, and detailed implementation plans (4000 plus words).",
-    }
-    depth_instruction = depth_instructions.get(analysis_depth, depth_instructions["comprehensive"])
+    depth_instruction = ANALYSIS_DEPTH_INSTRUCTIONS.get(analysis_depth, ANALYSIS_DEPTH_INSTRUCTIONS["comprehensive"])
     min_words = 800 if analysis_depth == "quick" else 2000
 
     required_section_titles: List[str] = []
@@ -451,11 +442,18 @@ async def generate_analytics_report(
 
     sections_text = "\n\n".join(sections)
 
+    # Sentence scans for the site and each competitor run in worker threads so a
+    # long page doesn't hold up the event loop for other in-flight requests.
+    site_evidence, *competitor_evidence = await asyncio.gather(
+        asyncio.to_thread(_build_site_evidence, website_data, normalized_url),
+        *(asyncio.to_thread(_build_one_competitor, d) for d in islice(competitor_data_list, _MAX_COMPETITOR_EVIDENCE)),
+    )
+
     evidence_summary = {
-        "site": _build_site_evidence(website_data, normalized_url),
-        "competitors": _build_competitor_evidence(competitor_data_list),
-        "traffic_data": _truncate_text(traffic_data_text, 2000),
-        "competitor_traffic_data": _truncate_text(competitor_traffic_data_text, 2000),
+        "site": site_evidence,
+        "competitors": competitor_evidence,
+        "traffic_data": truncate_text(traffic_data_text, 2000),
+        "competitor_traffic_data": truncate_text(competitor_traffic_data_text, 2000),
         "brand_visibility_evidence": brand_visibility_evidence,
         "competitor_brand_visibility_evidence": competitor_brand_evidence,
         "industry_context": industry_context,
@@ -465,7 +463,7 @@ async def generate_analytics_report(
             "competitor_crawl_available": bool(competitor_data_list),
         },
     }
-    evidence_json = json.dumps(evidence_summary, ensure_ascii=True, indent=2)
+    evidence_json = _evidence_json(evidence_summary)
     brand_visibility_no_data_hint = ""
     if not brand_visibility_text and not brand_visibility_evidence:
         brand_visibility_no_data_hint = (
@@ -473,20 +471,11 @@ async def generate_analytics_report(
             "For the 'Brand Visibility' section focus on competitors (use competitor data when available) and AI research (typical brand visibility, press/dev/community benchmarks for this industry) to give actionable recommendations. Do not write 'not available' or data-availability paragraphs.\n\n"
         )
 
-    system_prompt = f"""
-You are an expert digital marketing analyst and business intelligence consultant.
+    user_prompt = f"""
+Analyze the website and produce a comprehensive analytics report. Use AI research (industry benchmarks, best practices, typical metrics for this business type) together with the data below to make recommendations actionable and well-informed. When industry_context is present in the data, use it to focus comparisons and key metrics.
 
-Use AI research to enrich the report: conduct research using your knowledge where it helps—e.g. industry benchmarks for this business type, typical conversion rates, best practices for SaaS/ecommerce/content sites, common competitor tactics, SEO and performance norms. Combine that research with the crawled site and competitor data so recommendations are both data-driven and informed by best practices and benchmarks.
-Use the crawled site (title, meta, headings, content, features, links) and competitor crawl when provided. Give actionable advice: what is wrong and what to do next.
-Do not write "Not available in evidence" or "Data Availability" or long paragraphs about missing data. If data for a section is missing, give one short line and 1–2 concrete next steps (e.g. "Set up Google Analytics for [URL]" or "Add competitor URLs and re-run").
-Do not add Evidence lines or "evidence suggests." Use the actual data from the summary and your research to give clear, actionable recommendations.
-Reference competitors by name and URL when competitor data is in the summary. Be specific: which page, which fix, which tool.
 Minimum length: {depth_instruction}
 Language: {language}
-""".strip()
-
-    user_prompt = f"""
-Analyze the website and produce a comprehensive analytics report. Use AI research (industry benchmarks, best practices, typical metrics for this business type) together with the data below to make recommendations actionable and well-informed. When industry_context is present in the data, use it to focus comparisons and key metrics.
 
 Website URL
 {normalized_url}
@@ -507,9 +496,6 @@ The sections must appear in this exact order
 {", ".join(required_section_titles)}
 """.strip()
 
-    def _count_words(text: str) -> int:
-        return len([w for w in (text or "").split() if w.strip()])
-
     def _build_report_text(report_json: Dict[str, Any]) -> str:
         parts: List[str] = []
         for s in report_json.get("sections", []) or []:
@@ -568,12 +554,12 @@ The sections must appear in this exact order
         }
 
         messages = [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _ANALYTICS_SYSTEM_PROMPT},
             {"role": "user", "content": user_prompt},
         ]
 
         response = await client.chat.completions.create(
-            model=os.getenv("OPENAI_MODEL", "gpt-4o"),
+            model=OPENAI_MODEL,
             messages=messages,
             temperature=0.7,
             max_tokens=7000,
@@ -588,7 +574,7 @@ The sections must appear in this exact order
         report_json: Optional[Dict[str, Any]] = None
         report_text = ""
         try:
-            report_json = json.loads(raw_report)
+            report_json = orjson.loads(raw_report)
         except Exception:
             report_json = None
 
@@ -596,7 +582,7 @@ The sections must appear in this exact order
         if report_json:
             issues = _validate_report_schema(report_json)
             report_text = _build_report_text(report_json)
-            if (not issues) and (_count_words(report_text) >= min_words):
+            if (not issues) and (count_words(report_text) >= min_words):
                 needs_retry = False
 
         if needs_retry:
@@ -608,7 +594,7 @@ The sections must appear in this exact order
             )
 
             response2 = await client.chat.completions.create(
-                model=os.getenv("OPENAI_MODEL", "gpt-4o"),
+                model=OPENAI_MODEL,
                 messages=messages + [
                     {"role": "assistant", "content": raw_report},
                     {"role": "user", "content": follow_up},
@@ -622,7 +608,7 @@ The sections must appear in this exact order
             )
             raw_report = (response2.choices[0].message.content or "").strip()
             try:
-                report_json = json.loads(raw_report)
+                report_json = orjson.loads(raw_report)
                 if report_json:
                     report_text = _build_report_text(report_json)
             except Exception:
@@ -666,10 +652,10 @@ async def ai_rewrite_analytics_content(
 Keep the same structure (sections and headings). Improve clarity, actionability, and business intelligence tone. Preserve metrics, competitor names, and concrete recommendations; make executive summary punchy and recommendations specific (what to do, which URLs or tools). Do not add generic filler or "evidence" language.
 
 Original report:
-{_truncate_text(original_content, 12000)}
+{truncate_text(original_content, 12000)}
 """
         response = await client.chat.completions.create(
-            model=os.getenv("OPENAI_MODEL", "gpt-4o"),
+            model=OPENAI_MODEL,
             messages=[
                 {
                     "role": "system",
@@ -697,7 +683,7 @@ def analytics_quality_check(
     quality_score = 100
     report_lower = (report or "").lower()
 
-    word_count = len([w for w in (report or "").split() if w.strip()])
+    word_count = count_words(report)
     if word_count < 800:
         issues.append("Report is too short (under 800 words)")
         quality_score -= 20
@@ -772,7 +758,7 @@ Website: {website_url}
 Report focus: {context_str}
 
 Analytics report (excerpt):
-{_truncate_text(analytics_report, 5000)}
+{truncate_text(analytics_report, 5000)}
 
 Rules:
 - Derive recommendations only from the report: traffic, competitors, revenue, UX, marketing, tools. Be specific (which URL, which tool, which metric to add).
@@ -781,7 +767,7 @@ Rules:
 - Return markdown with clear headings and bullet points.
 """
         response = await client.chat.completions.create(
-            model=os.getenv("OPENAI_MODEL", "gpt-4o"),
+            model=OPENAI_MODEL,
             messages=[
                 {
                     "role": "system",
@@ -797,6 +783,7 @@ Rules:
         return f"# Error Generating Analytics Recommendations\n\nError: {str(e)}"
 
 
+@async_ttl_cache(ttl=6 * 3600)
 async def _get_industry_context_for_analytics(
     website_url: str,
     site_title: Optional[str] = None,
@@ -815,7 +802,7 @@ async def _get_industry_context_for_analytics(
             "(3) 1–2 key metrics or dimensions to focus on for this type of business. Plain text, no bullets or labels."
         )
         resp = await client.chat.completions.create(
-            model=os.getenv("OPENAI_MODEL", "gpt-4o"),
+            model=OPENAI_MODEL,
             messages=[
                 {
                     "role": "system",
@@ -827,18 +814,19 @@ async def _get_industry_context_for_analytics(
             max_tokens=250,
         )
         raw = (resp.choices[0].message.content or "").strip()
-        return _truncate_text(raw, 500) if raw else ""
+        return truncate_text(raw, 500) if raw else ""
     except Exception:
         return ""
 
 
+@async_ttl_cache(ttl=6 * 3600)
 async def _get_top_competitor_urls_for_analytics(website_url: str) -> List[str]:
     """Return 3 real competitor homepage URLs (same industry) for analytics comparison."""
     try:
         client = get_openai_client()
         domain = (urlparse(website_url).netloc or "").replace("www.", "") if website_url else ""
         resp = await client.chat.completions.create(
-            model=os.getenv("OPENAI_MODEL", "gpt-4o"),
+            model=OPENAI_MODEL,
             messages=[
                 {
                     "role": "system",
@@ -890,10 +878,7 @@ async def generate_analytics_action_points(
             urls_to_try = competitor_urls or await _get_top_competitor_urls_for_analytics(website_url)
             for first_url in (urls_to_try or [])[:1]:
                 try:
-                    u = first_url.strip()
-                    if not u.startswith(("http://", "https://")):
-                        u = f"https://{u}"
-                    u = u.rstrip("/")
+                    u = normalize_url(first_url)
                     competitor_crawl_data = await crawl_and_extract(u, use_js_render=use_js_render)
                     if competitor_crawl_data:
                         competitor_crawl_data["url"] = u
@@ -918,7 +903,7 @@ Features: {', '.join(c_features) if c_features else '—'}
 When extracting recommendations from the report, you may reference this competitor (e.g. "Competitor does X; apply similar to {website_url}") only where the report already mentions competitors or competitive analysis. Do not add new recommendations; only clarify or ground what is in the report.
 """
 
-        report_excerpt = _truncate_text(analytics_report, 6000)
+        report_excerpt = truncate_text(analytics_report, 6000)
         section_list = "Executive Summary, Traffic Analysis, Website Performance Metrics, Content Analysis, Brand Visibility, Competitive Analysis, Revenue Model Analysis, Marketing & Growth Analysis, Technical Infrastructure, User Experience & Conversion"
 
         prompt = f"""Extract RECOMMENDATIONS from this Website Analytics report. Output must match the report's sections and contain only recommendations that appear in the report.
@@ -947,7 +932,7 @@ OUTPUT FORMAT (Markdown):
 Continue for every section that appears in the report. Nothing else."""
 
         response = await client.chat.completions.create(
-            model=os.getenv("OPENAI_MODEL", "gpt-4o"),
+            model=OPENAI_MODEL,
             messages=[
                 {
                     "role": "system",
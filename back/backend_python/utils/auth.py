@@ -1,5 +1,7 @@
 import os
+import logging
 import boto3
+from botocore.config import Config
 from fastapi import HTTPException, Depends, Header, Request
 from typing import Optional
 import asyncio
@@ -7,10 +9,18 @@ from functools import wraps
 import time
 from collections import defaultdict
 
-# Initialize DynamoDB client
-dynamodb = boto3.client('dynamodb', region_name='us-west-2')
+# Initialize DynamoDB client once per process. Calls run in asyncio.to_thread
+# workers, so size the connection pool for concurrent requests (botocore
+# defaults to 10) and keep idle connections alive between them.
+dynamodb = boto3.client(
+    'dynamodb',
+    region_name='us-west-2',
+    config=Config(max_pool_connections=50, tcp_keepalive=True),
+)
 TABLE_NAME = 'reelpostly-tenants'
 
+log = logging.getLogger(__name__)
+
 # Production rate limiting with DynamoDB
 RATE_LIMIT_WINDOW = 60  # 1 minute
 MAX_REQUESTS_PER_WINDOW = 10  # 10 requests per minute per API key
@@ -26,7 +36,8 @@ class APIKeyAuth:
         """
         try:
             # Query DynamoDB for the API key
-            response = dynamodb.query(
+            response = await asyncio.to_thread(
+                dynamodb.query,
                 TableName=self.table_name,
                 KeyConditionExpression='apiKeyId = :api_key',
                 ExpressionAttributeValues={
@@ -65,7 +76,8 @@ class APIKeyAuth:
         """
         try:
             # Use atomic update to deduct credits
-            response = dynamodb.update_item(
+            response = await asyncio.to_thread(
+                dynamodb.update_item,
                 TableName=self.table_name,
                 Key={'apiKeyId': {'S': api_key_id}},
                 UpdateExpression='ADD credits :deduct',
@@ -79,7 +91,8 @@ class APIKeyAuth:
             
             if new_credits < 0:
                 # Rollback the deduction if insufficient credits
-                dynamodb.update_item(
+                await asyncio.to_thread(
+                    dynamodb.update_item,
                     TableName=self.table_name,
                     Key={'apiKeyId': {'S': api_key_id}},
                     UpdateExpression='ADD credits :rollback',
@@ -158,7 +171,8 @@ async def check_rate_limit(api_key: str) -> bool:
     
     try:
         # Get current request count for this API key in the time window
-        response = dynamodb.query(
+        response = await asyncio.to_thread(
+            dynamodb.query,
             TableName=RATE_LIMIT_TABLE,
             KeyConditionExpression='api_key = :api_key AND request_time > :window_start',
             ExpressionAttributeValues={
@@ -175,7 +189,8 @@ async def check_rate_limit(api_key: str) -> bool:
             return False
         
         # Add current request to DynamoDB
-        dynamodb.put_item(
+        await asyncio.to_thread(
+            dynamodb.put_item,
             TableName=RATE_LIMIT_TABLE,
             Item={
                 'api_key': {'S': api_key},
@@ -188,7 +203,7 @@ async def check_rate_limit(api_key: str) -> bool:
         
     except Exception as e:
         # If DynamoDB fails, allow the request (fail open)
-        print(f"Rate limit check failed: {e}")
+        log.warning("Rate limit check failed: %s", e)
         return True
 
 def require_rate_limit():
@@ -44,6 +44,9 @@ from datetime import datetime, timedelta
 from urllib.parse import urlparse, quote_plus
 
 import aiohttp
+import orjson
+
+from utils.http_client import get_http_session
 
 try:
     import feedparser
@@ -56,6 +59,24 @@ except Exception:
 RATE_LIMIT_DELAY_S = float(os.getenv("BRAND_VIS_RATE_LIMIT_DELAY_S", "0.35"))
 DEFAULT_TIMEOUT_S = float(os.getenv("BRAND_VIS_TIMEOUT_S", "15"))
 MAX_EVIDENCE_TOTAL = int(os.getenv("BRAND_VIS_MAX_EVIDENCE_TOTAL", "20"))
+MAX_CONCURRENCY = int(os.getenv("BRAND_VIS_MAX_CONCURRENCY", "3"))
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() in ("1", "true", "yes", "y")
+
+
+# Source toggles and keys are read once at import, not on every lookup.
+ENABLE_GOOGLE_NEWS = _env_flag("ENABLE_GOOGLE_NEWS", "true")
+ENABLE_GITHUB = _env_flag("ENABLE_GITHUB", "true")
+ENABLE_HACKERNEWS = _env_flag("ENABLE_HACKERNEWS", "true")
+ENABLE_WIKIPEDIA = _env_flag("ENABLE_WIKIPEDIA", "true")
+ENABLE_PAGESPEED = _env_flag("ENABLE_PAGESPEED", "true")
+ENABLE_BUILTWITH = _env_flag("ENABLE_BUILTWITH", "false")
+
+GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+GOOGLE_PAGESPEED_API_KEY = os.getenv("GOOGLE_PAGESPEED_API_KEY", "").strip()
+BUILTWITH_API_KEY = os.getenv("BUILTWITH_API_KEY", "").strip()
 
 DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; RealDocBot/1.0; +https://myinsightiq.com)",
@@ -117,7 +138,7 @@ def _evidence_item(
 
 async def _get_text(session: aiohttp.ClientSession, url: str, timeout_s: float) -> Optional[str]:
     try:
-        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout_s)) as resp:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout_s), headers=DEFAULT_HEADERS) as resp:
             if resp.status != 200:
                 return None
             return await resp.text(errors="ignore")
@@ -130,11 +151,11 @@ async def _get_json(session: aiohttp.ClientSession, url: str, timeout_s: float,
         async with session.get(
             url,
             timeout=aiohttp.ClientTimeout(total=timeout_s),
-            headers=headers or {},
+            headers={**DEFAULT_HEADERS, **headers} if headers else DEFAULT_HEADERS,
         ) as resp:
             if resp.status != 200:
                 return None
-            return await resp.json()
+            return orjson.loads(await resp.read())
     except Exception:
         return None
 
@@ -144,7 +165,7 @@ async def get_google_news_mentions(
     website_url: Optional[str] = None,
     max_results: int = 5,
 ) -> Dict[str, Any]:
-    if os.getenv("ENABLE_GOOGLE_NEWS", "true").lower() not in ("1", "true", "yes", "y"):
+    if not ENABLE_GOOGLE_NEWS:
         return {"available": False, "source": "google_news_rss", "evidence": [], "error": "disabled"}
 
     if not FEEDPARSER_AVAILABLE:
@@ -157,46 +178,47 @@ async def get_google_news_mentions(
 
     rss_url = f"https://news.google.com/rss/search?q={quote_plus(query)}&hl=en&gl=US&ceid=US:en"
 
-    async with aiohttp.ClientSession(headers=DEFAULT_HEADERS) as session:
-        await asyncio.sleep(RATE_LIMIT_DELAY_S)
-        content = await _get_text(session, rss_url, timeout_s=DEFAULT_TIMEOUT_S)
-        if not content:
-            return {"available": False, "source": "google_news_rss", "evidence": [], "error": "fetch_failed"}
-
-        feed = feedparser.parse(content)
-        items: List[Dict[str, Any]] = []
-
-        for entry in (feed.entries or [])[: max_results]:
-            title = entry.get("title", "") or ""
-            link = entry.get("link", "") or ""
-            published = entry.get("published", "") or ""
-            summary = entry.get("summary", "") or ""
-
-            items.append(
-                _evidence_item(
-                    source="google_news_rss",
-                    confidence="rss",
-                    signal_type="press",
-                    url=link,
-                    title=title,
-                    date=published,
-                    snippet=summary,
-                    meta={"query": query},
-                )
+    session = get_http_session()
+    await asyncio.sleep(RATE_LIMIT_DELAY_S)
+    content = await _get_text(session, rss_url, timeout_s=DEFAULT_TIMEOUT_S)
+    if not content:
+        return {"available": False, "source": "google_news_rss", "evidence": [], "error": "fetch_failed"}
+
+    # feedparser is a synchronous XML parser; keep it off the event loop
+    feed = await asyncio.to_thread(feedparser.parse, content)
+    items: List[Dict[str, Any]] = []
+
+    for entry in (feed.entries or [])[: max_results]:
+        title = entry.get("title", "") or ""
+        link = entry.get("link", "") or ""
+        published = entry.get("published", "") or ""
+        summary = entry.get("summary", "") or ""
+
+        items.append(
+            _evidence_item(
+                source="google_news_rss",
+                confidence="rss",
+                signal_type="press",
+                url=link,
+                title=title,
+                date=published,
+                snippet=summary,
+                meta={"query": query},
             )
+        )
 
-        return {
-            "available": len(items) > 0,
-            "source": "google_news_rss",
-            "evidence": items,
-        }
+    return {
+        "available": len(items) > 0,
+        "source": "google_news_rss",
+        "evidence": items,
+    }
 
 
 async def get_github_mentions(
     brand_name: str,
     max_results: int = 5,
 ) -> Dict[str, Any]:
-    if os.getenv("ENABLE_GITHUB", "true").lower() not in ("1", "true", "yes", "y"):
+    if not ENABLE_GITHUB:
         return {"available": False, "source": "github", "evidence": [], "error": "disabled"}
 
     q = quote_plus(brand_name.strip())
@@ -207,130 +229,130 @@ async def get_github_mentions(
         "User-Agent": "RealDoc-BrandVisibility",
     }
 
-    token = os.getenv("GITHUB_TOKEN")
+    token = GITHUB_TOKEN
     if token:
         headers["Authorization"] = f"Bearer {token}"
 
-    async with aiohttp.ClientSession(headers=DEFAULT_HEADERS) as session:
-        await asyncio.sleep(RATE_LIMIT_DELAY_S)
-        data = await _get_json(session, url, timeout_s=DEFAULT_TIMEOUT_S, headers=headers)
-        if not data:
-            return {"available": False, "source": "github", "evidence": [], "error": "fetch_failed"}
-
-        items: List[Dict[str, Any]] = []
-        for repo in (data.get("items") or [])[:max_results]:
-            items.append(
-                _evidence_item(
-                    source="github",
-                    confidence="api",
-                    signal_type="dev",
-                    url=repo.get("html_url", "") or "",
-                    title=repo.get("full_name", "") or repo.get("name", "") or "",
-                    date=repo.get("updated_at", "") or "",
-                    snippet=repo.get("description", "") or "",
-                    meta={
-                        "stars": repo.get("stargazers_count", 0),
-                        "language": repo.get("language", "") or "",
-                    },
-                )
+    session = get_http_session()
+    await asyncio.sleep(RATE_LIMIT_DELAY_S)
+    data = await _get_json(session, url, timeout_s=DEFAULT_TIMEOUT_S, headers=headers)
+    if not data:
+        return {"available": False, "source": "github", "evidence": [], "error": "fetch_failed"}
+
+    items: List[Dict[str, Any]] = []
+    for repo in (data.get("items") or [])[:max_results]:
+        items.append(
+            _evidence_item(
+                source="github",
+                confidence="api",
+                signal_type="dev",
+                url=repo.get("html_url", "") or "",
+                title=repo.get("full_name", "") or repo.get("name", "") or "",
+                date=repo.get("updated_at", "") or "",
+                snippet=repo.get("description", "") or "",
+                meta={
+                    "stars": repo.get("stargazers_count", 0),
+                    "language": repo.get("language", "") or "",
+                },
             )
+        )
 
-        return {"available": len(items) > 0, "source": "github", "evidence": items}
+    return {"available": len(items) > 0, "source": "github", "evidence": items}
 
 
 async def get_hackernews_mentions(
     brand_name: str,
     max_results: int = 5,
 ) -> Dict[str, Any]:
-    if os.getenv("ENABLE_HACKERNEWS", "true").lower() not in ("1", "true", "yes", "y"):
+    if not ENABLE_HACKERNEWS:
         return {"available": False, "source": "hackernews", "evidence": [], "error": "disabled"}
 
     q = quote_plus(brand_name.strip())
     url = f"https://hn.algolia.com/api/v1/search?query={q}&tags=story&hitsPerPage={min(max_results, 20)}"
 
-    async with aiohttp.ClientSession(headers=DEFAULT_HEADERS) as session:
-        await asyncio.sleep(RATE_LIMIT_DELAY_S)
-        data = await _get_json(session, url, timeout_s=DEFAULT_TIMEOUT_S)
-        if not data:
-            return {"available": False, "source": "hackernews", "evidence": [], "error": "fetch_failed"}
-
-        items: List[Dict[str, Any]] = []
-        for hit in (data.get("hits") or [])[:max_results]:
-            object_id = hit.get("objectID", "") or ""
-            hn_url = f"https://news.ycombinator.com/item?id={object_id}" if object_id else ""
-            title = hit.get("title", "") or ""
-            link = hit.get("url", "") or hn_url
-
-            created_at = hit.get("created_at", "") or ""
-
-            items.append(
-                _evidence_item(
-                    source="hackernews",
-                    confidence="api",
-                    signal_type="community",
-                    url=hn_url or link,
-                    title=title,
-                    date=created_at,
-                    snippet=title,
-                    meta={
-                        "points": hit.get("points", 0),
-                        "comments": hit.get("num_comments", 0),
-                        "external_url": link,
-                    },
-                )
+    session = get_http_session()
+    await asyncio.sleep(RATE_LIMIT_DELAY_S)
+    data = await _get_json(session, url, timeout_s=DEFAULT_TIMEOUT_S)
+    if not data:
+        return {"available": False, "source": "hackernews", "evidence": [], "error": "fetch_failed"}
+
+    items: List[Dict[str, Any]] = []
+    for hit in (data.get("hits") or [])[:max_results]:
+        object_id = hit.get("objectID", "") or ""
+        hn_url = f"https://news.ycombinator.com/item?id={object_id}" if object_id else ""
+        title = hit.get("title", "") or ""
+        link = hit.get("url", "") or hn_url
+
+        created_at = hit.get("created_at", "") or ""
+
+        items.append(
+            _evidence_item(
+                source="hackernews",
+                confidence="api",
+                signal_type="community",
+                url=hn_url or link,
+                title=title,
+                date=created_at,
+                snippet=title,
+                meta={
+                    "points": hit.get("points", 0),
+                    "comments": hit.get("num_comments", 0),
+                    "external_url": link,
+                },
             )
+        )
 
-        return {"available": len(items) > 0, "source": "hackernews", "evidence": items}
+    return {"available": len(items) > 0, "source": "hackernews", "evidence": items}
 
 
 async def get_wikipedia_data(brand_name: str) -> Dict[str, Any]:
-    if os.getenv("ENABLE_WIKIPEDIA", "true").lower() not in ("1", "true", "yes", "y"):
+    if not ENABLE_WIKIPEDIA:
         return {"available": False, "source": "wikipedia", "evidence": [], "error": "disabled"}
 
     title = quote_plus(brand_name.strip())
     url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{title}"
 
-    async with aiohttp.ClientSession(headers=DEFAULT_HEADERS) as session:
-        await asyncio.sleep(RATE_LIMIT_DELAY_S)
-        data = await _get_json(session, url, timeout_s=DEFAULT_TIMEOUT_S)
-        if not data:
-            return {"available": False, "source": "wikipedia", "evidence": [], "error": "fetch_failed"}
+    session = get_http_session()
+    await asyncio.sleep(RATE_LIMIT_DELAY_S)
+    data = await _get_json(session, url, timeout_s=DEFAULT_TIMEOUT_S)
+    if not data:
+        return {"available": False, "source": "wikipedia", "evidence": [], "error": "fetch_failed"}
 
-        if data.get("type") == "https://mediawiki.org/wiki/HyperSwitch/errors/not_found":
-            return {
-                "available": False,
-                "source": "wikipedia",
-                "evidence": [],
-                "error": "no_page_found",
-            }
+    if data.get("type") == "https://mediawiki.org/wiki/HyperSwitch/errors/not_found":
+        return {
+            "available": False,
+            "source": "wikipedia",
+            "evidence": [],
+            "error": "no_page_found",
+        }
 
+    page_url = ""
+    try:
+        page_url = (data.get("content_urls") or {}).get("desktop", {}).get("page", "") or ""
+    except Exception:
         page_url = ""
-        try:
-            page_url = (data.get("content_urls") or {}).get("desktop", {}).get("page", "") or ""
-        except Exception:
-            page_url = ""
-
-        extract = data.get("extract", "") or ""
-        page_title = data.get("title", "") or brand_name
-
-        item = _evidence_item(
-            source="wikipedia",
-            confidence="api",
-            signal_type="reputation",
-            url=page_url,
-            title=page_title,
-            date="",
-            snippet=extract,
-        )
 
-        return {"available": True, "source": "wikipedia", "evidence": [item]}
+    extract = data.get("extract", "") or ""
+    page_title = data.get("title", "") or brand_name
+
+    item = _evidence_item(
+        source="wikipedia",
+        confidence="api",
+        signal_type="reputation",
+        url=page_url,
+        title=page_title,
+        date="",
+        snippet=extract,
+    )
+
+    return {"available": True, "source": "wikipedia", "evidence": [item]}
 
 
 async def get_pagespeed_insights(website_url: str) -> Dict[str, Any]:
-    if os.getenv("ENABLE_PAGESPEED", "true").lower() not in ("1", "true", "yes", "y"):
+    if not ENABLE_PAGESPEED:
         return {"available": False, "source": "pagespeed_insights", "evidence": [], "error": "disabled"}
 
-    api_key = os.getenv("GOOGLE_PAGESPEED_API_KEY", "").strip()
+    api_key = GOOGLE_PAGESPEED_API_KEY
     base = "https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
     u = quote_plus(website_url)
     if api_key:
@@ -338,98 +360,98 @@ async def get_pagespeed_insights(website_url: str) -> Dict[str, Any]:
     else:
         url = f"{base}?url={u}"
 
-    async with aiohttp.ClientSession(headers=DEFAULT_HEADERS) as session:
-        await asyncio.sleep(RATE_LIMIT_DELAY_S)
-        data = await _get_json(session, url, timeout_s=30.0)
-        if not data:
-            return {"available": False, "source": "pagespeed_insights", "evidence": [], "error": "fetch_failed"}
-
-        lighthouse = data.get("lighthouseResult") or {}
-        categories = lighthouse.get("categories") or {}
-
-        def _score(name: str) -> int:
-            v = (categories.get(name) or {}).get("score", None)
-            if v is None:
-                return 0
-            try:
-                return int(float(v) * 100)
-            except Exception:
-                return 0
-
-        perf = _score("performance")
-        seo = _score("seo")
-        access = _score("accessibility")
-        best = _score("best-practices")
-
-        audits = lighthouse.get("audits") or {}
-        lcp = (audits.get("largest-contentful-paint") or {}).get("numericValue", None)
-        cls = (audits.get("cumulative-layout-shift") or {}).get("numericValue", None)
-
-        title = f"PageSpeed scores performance {perf} seo {seo}"
-        snippet = f"Performance {perf} SEO {seo} Accessibility {access} BestPractices {best}"
-
-        item = _evidence_item(
-            source="pagespeed_insights",
-            confidence="api",
-            signal_type="performance",
-            url=url,
-            title=title,
-            date=_now_iso(),
-            snippet=snippet,
-            meta={
-                "performance_score": perf,
-                "seo_score": seo,
-                "accessibility_score": access,
-                "best_practices_score": best,
-                "lcp_ms": lcp,
-                "cls": cls,
-                "using_api_key": bool(api_key),
-            },
-        )
+    session = get_http_session()
+    await asyncio.sleep(RATE_LIMIT_DELAY_S)
+    data = await _get_json(session, url, timeout_s=30.0)
+    if not data:
+        return {"available": False, "source": "pagespeed_insights", "evidence": [], "error": "fetch_failed"}
 
-        return {"available": True, "source": "pagespeed_insights", "evidence": [item]}
+    lighthouse = data.get("lighthouseResult") or {}
+    categories = lighthouse.get("categories") or {}
+
+    def _score(name: str) -> int:
+        v = (categories.get(name) or {}).get("score", None)
+        if v is None:
+            return 0
+        try:
+            return int(float(v) * 100)
+        except Exception:
+            return 0
+
+    perf = _score("performance")
+    seo = _score("seo")
+    access = _score("accessibility")
+    best = _score("best-practices")
+
+    audits = lighthouse.get("audits") or {}
+    lcp = (audits.get("largest-contentful-paint") or {}).get("numericValue", None)
+    cls = (audits.get("cumulative-layout-shift") or {}).get("numericValue", None)
+
+    title = f"PageSpeed scores performance {perf} seo {seo}"
+    snippet = f"Performance {perf} SEO {seo} Accessibility {access} BestPractices {best}"
+
+    item = _evidence_item(
+        source="pagespeed_insights",
+        confidence="api",
+        signal_type="performance",
+        url=url,
+        title=title,
+        date=_now_iso(),
+        snippet=snippet,
+        meta={
+            "performance_score": perf,
+            "seo_score": seo,
+            "accessibility_score": access,
+            "best_practices_score": best,
+            "lcp_ms": lcp,
+            "cls": cls,
+            "using_api_key": bool(api_key),
+        },
+    )
+
+    return {"available": True, "source": "pagespeed_insights", "evidence": [item]}
 
 
 async def get_builtwith_data(website_url: str) -> Dict[str, Any]:
-    if os.getenv("ENABLE_BUILTWITH", "false").lower() not in ("1", "true", "yes", "y"):
+    if not ENABLE_BUILTWITH:
         return {"available": False, "source": "builtwith", "evidence": [], "error": "disabled"}
 
-    api_key = os.getenv("BUILTWITH_API_KEY", "").strip()
+    api_key = BUILTWITH_API_KEY
     if not api_key:
         return {"available": False, "source": "builtwith", "evidence": [], "error": "missing_api_key"}
 
     domain = _domain_from_url(website_url) or website_url
     url = f"https://api.builtwith.com/v20/api.json?KEY={quote_plus(api_key)}&LOOKUP={quote_plus(domain)}"
 
-    async with aiohttp.ClientSession(headers=DEFAULT_HEADERS) as session:
-        await asyncio.sleep(RATE_LIMIT_DELAY_S)
-        data = await _get_json(session, url, timeout_s=DEFAULT_TIMEOUT_S)
-        if not data:
-            return {"available": False, "source": "builtwith", "evidence": [], "error": "fetch_failed"}
+    session = get_http_session()
+    await asyncio.sleep(RATE_LIMIT_DELAY_S)
+    data = await _get_json(session, url, timeout_s=DEFAULT_TIMEOUT_S)
+    if not data:
+        return {"available": False, "source": "builtwith", "evidence": [], "error": "fetch_failed"}
 
-        tech_names: List[str] = []
-        try:
-            groups = (((data.get("Results") or [])[0] or {}).get("Result") or {}).get("Paths") or []
-            for g in groups[:8]:
-                tg = g.get("Technologies") or []
-                for t in tg[:12]:
-                    name = (t.get("Name") or "").strip()
-                    if name and name not in tech_names:
-                        tech_names.append(name)
-        except Exception:
-            tech_names = []
-
-        item = _evidence_item(
-            source="builtwith",
-            confidence="api",
-            signal_type="tech_stack",
-            url=url,
-            title=f"BuiltWith tech stack for {domain}",
-            date=_now_iso(),
-            snippet="Tech stack returned by BuiltWith API",
-            meta={"domain": domain, "tech": tech_names[:25]},
-        )
-        return {"available": True, "source": "builtwith", "evidence": [item]}
+    tech_names: List[str] = []
+    try:
+        groups = (((data.get("Results") or [])[0] or {}).get("Result") or {}).get("Paths") or []
+        for g in groups[:8]:
+            tg = g.get("Technologies") or []
+            for t in tg[:12]:
+                name = (t.get("Name") or "").strip()
+                if name and name not in tech_names:
+                    tech_names.append(name)
+    except Exception:
+        tech_names = []
+
+    item = _evidence_item(
+        source="builtwith",
+        confidence="api",
+        signal_type="tech_stack",
+        url=url,
+        title=f"BuiltWith tech stack for {domain}",
+        date=_now_iso(),
+        snippet="Tech stack returned by BuiltWith API",
+        meta={"domain": domain, "tech": tech_names[:25]},
+    )
+    return {"available": True, "source": "builtwith", "evidence": [item]}
 
 
 def _dedupe_evidence(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -513,101 +535,7 @@ async def get_brand_visibility_data(
             "evidence": [],
         }
 
-    tasks: List[asyncio.Task] = []
-    sources_requested: List[str] = []
-
-    if include_press:
-        sources_requested.append("google_news_rss")
-        tasks.append(asyncio.create_task(get_google_news_mentions(brand_name, website_url, max_results_per_source)))
-
-    if include_dev:
-        sources_requested.append("github")
-        tasks.append(asyncio.create_task(get_github_mentions(brand_name, max_results_per_source)))
-
-    if include_community:
-        sources_requested.append("hackernews")
-        tasks.append(asyncio.create_task(get_hackernews_mentions(brand_name, max_results_per_source)))
-
-    if include_reputation:
-        sources_requested.append("wikipedia")
-        tasks.append(asyncio.create_task(get_wikipedia_data(brand_name)))
-
-    if include_performance and website_url:
-        sources_requested.append("pagespeed_insights")
-        tasks.append(asyncio.create_task(get_pagespeed_insights(website_url)))
-
-    if include_tech_stack and website_url:
-        sources_requested.append("builtwith")
-        tasks.append(asyncio.create_task(get_builtwith_data(website_url)))
-
-    try:
-        results = await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout=30.0)
-    except asyncio.TimeoutError:
-        results = []
-
-    evidence: List[Dict[str, Any]] = []
-    used_sources: List[str] = []
-    errors: Dict[str, str] = {}
-
-    for res in results:
-        if isinstance(res, Exception):
-            continue
-        if not isinstance(res, dict):
-            continue
-
-        src = res.get("source", "")
-        if res.get("available"):
-            used_sources.append(src)
-            evidence.extend(res.get("evidence") or [])
-        else:
-            if src:
-                errors[src] = res.get("error", "not_available")
-
-    evidence = _dedupe_evidence(evidence)
-    evidence = evidence[:MAX_EVIDENCE_TOTAL]
-
-    available = len(evidence) > 0
-
-    summary = {
-        "brand_name": brand_name,
-        "website_url": website_url or "",
-        "requested_sources": sources_requested,
-        "used_sources": used_sources,
-        "total_evidence_items": len(evidence),
-        "generated_at": _now_iso(),
-    }
-    if errors:
-        summary["errors"] = errors
-
-    return {
-        "available": available,
-        "sources": used_sources,
-        "summary": summary,
-        "evidence": evidence,
-    }
-
-
-async def get_brand_visibility_data(
-    brand_name: str,
-    website_url: Optional[str] = None,
-    max_results_per_source: int = 5,
-    include_press: bool = True,
-    include_community: bool = True,
-    include_dev: bool = True,
-    include_reputation: bool = True,
-    include_performance: bool = False,
-    include_tech_stack: bool = False,
-) -> Dict[str, Any]:
-    brand_name = (brand_name or "").strip()
-    if not brand_name:
-        return {
-            "available": False,
-            "sources": [],
-            "summary": {"error": "missing_brand_name"},
-            "evidence": [],
-        }
-
-    sem = asyncio.Semaphore(int(os.getenv("BRAND_VIS_MAX_CONCURRENCY", "3")))
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
 
     async def _run(coro):
         async with sem:
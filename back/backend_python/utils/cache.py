@@ -0,0 +1,49 @@
+"""
+Small in-process TTL cache for async helpers.
+
+Used in front of the "lookup" model calls (industry context, competitor
+discovery) and the page crawler, so repeat requests for the same site within
+the TTL skip the round-trip. Per worker, bounded, no external store.
+"""
+
+import copy
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Awaitable, Callable, Hashable, Tuple
+
+
+def async_ttl_cache(ttl: float = 3600.0, maxsize: int = 256):
+    """
+    Cache results of an async function by its (hashable) arguments.
+
+    Falsy results ("" / [] / None) are not cached, so a failed or empty
+    lookup is retried on the next call. Values are deep-copied on store and on
+    every hit, so callers may mutate results (including nested crawl lists)
+    without touching the cached entry or other requests.
+    """
+
+    def decorator(fn: Callable[..., Awaitable[Any]]):
+        entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+        @wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            hit = entries.get(key)
+            if hit is not None and hit[0] > now:
+                entries.move_to_end(key)
+                return copy.deepcopy(hit[1])
+
+            value = await fn(*args, **kwargs)
+            if value:
+                entries[key] = (now + ttl, copy.deepcopy(value))
+                entries.move_to_end(key)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return value
+
+        wrapper.cache_clear = entries.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
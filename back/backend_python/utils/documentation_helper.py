@@ -1,58 +1,22 @@
 from __future__ import annotations
 
-import os
-import json
 import asyncio
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 
-from dotenv import load_dotenv
-from openai import AsyncOpenAI
 from urllib.parse import urlparse
 
+import orjson
+
 from utils.web_crawler import crawl_and_extract, format_crawled_content_for_prompt, crawl_competitors
 from utils.brand_visibility_helper import get_brand_visibility_data, format_brand_visibility_data_for_prompt
+from utils.openai_client import get_openai_client
+from utils.text import _evidence_json, count_words, normalize_url
 
 
-load_dotenv()
-
 HYPHEN = chr(45)
 
 
-def get_openai_client() -> AsyncOpenAI:
-    api_key = os.getenv("OPENAI_API_KEY", "").strip()
-    if not api_key:
-        raise ValueError(
-            "OpenAI API key is not configured. Please set OPENAI_API_KEY in your env file. "
-            "Get your API key from https://platform.openai.com/api-keys"
-        )
-
-    lower_key = api_key.lower()
-    if lower_key == ("sk" + HYPHEN + "placeholder") or lower_key.startswith("sk" + HYPHEN + "placeholder"):
-        raise ValueError(
-            "OpenAI API key is not configured. Please set OPENAI_API_KEY in your env file. "
-            "Get your API key from https://platform.openai.com/api-keys"
-        )
-
-    if lower_key == "sk_placeholder" or lower_key.startswith("sk_placeholder"):
-        raise ValueError(
-            "OpenAI API key is not configured. Please set OPENAI_API_KEY in your env file. "
-            "Get your API key from https://platform.openai.com/api-keys"
-        )
-
-    return AsyncOpenAI(api_key=api_key)
-
-
-def _normalize_url(u: Optional[str]) -> Optional[str]:
-    if not u:
-        return None
-    s = u.strip()
-    if not s:
-        return None
-    if not (s.startswith("http://") or s.startswith("https://")):
-        s = "https://" + s
-    return s.rstrip("/")
-
-
 def _safe_brand_name(app_name: str, website_url: Optional[str], crawled_title: str) -> str:
     if crawled_title:
         t = crawled_title.split("|")[0].strip()
@@ -81,10 +45,6 @@ def _safe_brand_name(app_name: str, website_url: Optional[str], crawled_title: s
     return "Unknown"
 
 
-def _count_words(text: str) -> int:
-    return len([w for w in (text or "").split() if w.strip()])
-
-
 def _truncate(text: str, limit: int) -> str:
     s = (text or "").strip()
     if len(s) <= limit:
@@ -92,6 +52,7 @@ def _truncate(text: str, limit: int) -> str:
     return s[: max(0, limit - 3)].rstrip() + "..."
 
 
+@lru_cache(maxsize=32)
 def _normalize_doc_type(doc_type: str) -> str:
     s = (doc_type or "").strip().lower()
     if not s:
@@ -103,6 +64,7 @@ def _normalize_doc_type(doc_type: str) -> str:
     return s
 
 
+@lru_cache(maxsize=32)
 def _normalize_format(output_format: str) -> str:
     s = (output_format or "").strip().lower()
     if not s:
@@ -193,6 +155,22 @@ def _build_evidence_summary(
     }
 
 
+_FORMAT_INSTRUCTIONS = {
+    "markdown": "Use Markdown headings, lists, and code blocks.",
+    "html": "Use semantic HTML with headings, lists, and code blocks.",
+    "plain_text": "Use plain text with clear spacing and section titles.",
+}
+
+_SYSTEM_PROMPT = (
+    "You are an expert technical writer. "
+    "You must be accurate and evidence grounded. "
+    "Never invent endpoints, commands, UI labels, pricing, limits, or features. "
+    "If a detail is missing in evidence, write Not available in evidence. "
+    "Write for the requested audience and level. "
+    "Return only valid JSON that matches the required schema."
+)
+
+
 async def generate_documentation(
     app_name: str,
     app_type: str,
@@ -218,11 +196,11 @@ async def generate_documentation(
     evidence_summary dict
     """
 
-    normalized_app_url = _normalize_url(app_url)
+    normalized_app_url = normalize_url(app_url) or None
     normalized_competitors: List[str] = []
     if competitor_urls:
         for u in competitor_urls:
-            nu = _normalize_url(u)
+            nu = normalize_url(u) or None
             if nu:
                 normalized_competitors.append(nu)
 
@@ -342,26 +320,12 @@ async def generate_documentation(
         competitor_urls=normalized_competitors,
     )
 
-    evidence_json = json.dumps(evidence_summary, ensure_ascii=True, indent=2)
+    evidence_json = _evidence_json(evidence_summary)
 
-    format_map = {
-        "markdown": "Use Markdown headings, lists, and code blocks.",
-        "html": "Use semantic HTML with headings, lists, and code blocks.",
-        "plain_text": "Use plain text with clear spacing and section titles.",
-    }
-    fmt_instruction = format_map.get(format_norm, format_map["markdown"])
+    fmt_instruction = _FORMAT_INSTRUCTIONS.get(format_norm, _FORMAT_INSTRUCTIONS["markdown"])
 
     min_words = 900
 
-    system_prompt = (
-        "You are an expert technical writer. "
-        "You must be accurate and evidence grounded. "
-        "Never invent endpoints, commands, UI labels, pricing, limits, or features. "
-        "If a detail is missing in evidence, write Not available in evidence. "
-        "Write for the requested audience and level. "
-        "Return only valid JSON that matches the required schema."
-    )
-
     guidance: List[str] = []
     if include_code_examples:
         guidance.append("Include code examples only when evidence supports the exact command or endpoint. Otherwise write Not available in evidence.")
@@ -424,16 +388,16 @@ async def generate_documentation(
         )
         return (resp.choices[0].message.content or "").strip()
 
-    messages = [{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}]
+    messages = [{"role": "system", "content": _SYSTEM_PROMPT}, {"role": "user", "content": user_prompt}]
     raw = await _call(messages)
 
     doc_json: Dict[str, Any] = {}
     try:
-        doc_json = json.loads(raw)
+        doc_json = orjson.loads(raw)
     except Exception:
         doc_json = {"content": ""}
 
-    if _count_words(doc_json.get("content", "")) < min_words:
+    if count_words(doc_json.get("content", "")) < min_words:
         retry_prompt = (
             "Your output is too short. Expand to at least "
             + str(min_words)
@@ -442,7 +406,7 @@ async def generate_documentation(
         )
         raw_retry = await _call(messages + [{"role": "assistant", "content": raw}, {"role": "user", "content": retry_prompt}])
         try:
-            doc_json = json.loads(raw_retry)
+            doc_json = orjson.loads(raw_retry)
         except Exception:
             doc_json = {"content": doc_json.get("content", "")}
 
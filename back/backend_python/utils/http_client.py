@@ -0,0 +1,38 @@
+"""
+Shared aiohttp session for outbound API calls.
+
+Brand-visibility sources, SimilarWeb, search suggestions and the SEO technical
+fetches all go through one pooled session per worker, so repeat calls to the
+same hosts reuse keep-alive connections instead of a new TCP/TLS handshake per
+helper call. The page crawler keeps its own per-crawl session (it needs a
+fresh cookie jar for each site).
+
+Callers pass their own headers and per-request timeouts. main.py closes the
+session on shutdown.
+"""
+
+from typing import Optional
+
+import aiohttp
+
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    # Created lazily so it binds to the running event loop (uvicorn's), not import time.
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=30),
+            cookie_jar=aiohttp.DummyCookieJar(),  # no cookies shared between unrelated requests
+            timeout=aiohttp.ClientTimeout(total=60),
+        )
+    return _session
+
+
+async def close_http_session() -> None:
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
@@ -1,55 +1,50 @@
 """
 Enhanced logging utility - enables better error visibility in CloudWatch
+
+Thin wrapper over the stdlib logging module. main.py sets the level once
+(WARNING in production, INFO otherwise); disabled levels return before any
+message is formatted. exc_info / stack_info are passed through to logging.
 """
-import os
-import sys
-import traceback
-import datetime
+import logging
+
+_log = logging.getLogger("docsgen")
+
+
+def _emit(level: int, args, exc_info=False, stack_info: bool = False) -> None:
+    if _log.isEnabledFor(level):
+        _log.log(level, " ".join(str(a) for a in args), exc_info=exc_info, stack_info=stack_info)
 
-IS_PRODUCTION = os.getenv('NODE_ENV') == 'production' or os.getenv('ENVIRONMENT') == 'production'
 
 class Logger:
     @staticmethod
-    def log(*args, **kwargs):
-        """Log only in development"""
-        if not IS_PRODUCTION:
-            print(*args, **kwargs, file=sys.stdout)
-    
+    def log(*args, exc_info=False, stack_info: bool = False):
+        """Log only in development (INFO level)"""
+        _emit(logging.INFO, args, exc_info, stack_info)
+
     @staticmethod
-    def error(*args, **kwargs):
-        """Always log errors (even in production) - Enhanced for CloudWatch"""
-        print(f"[ERROR] {datetime.now().isoformat()}", *args, **kwargs, file=sys.stderr)
-        # Also print to stdout for CloudWatch visibility
-        print(f"[ERROR] {datetime.now().isoformat()}", *args, **kwargs, file=sys.stdout)
-    
+    def error(*args, exc_info=False, stack_info: bool = False):
+        """Always log errors (even in production)"""
+        _emit(logging.ERROR, args, exc_info, stack_info)
+
     @staticmethod
-    def warn(*args, **kwargs):
-        """Log warnings only in development"""
-        if not IS_PRODUCTION:
-            print(*args, **kwargs, file=sys.stderr)
-    
+    def warn(*args, exc_info=False, stack_info: bool = False):
+        """Log warnings (in production too, since the production level is WARNING)"""
+        _emit(logging.WARNING, args, exc_info, stack_info)
+
     @staticmethod
-    def info(*args, **kwargs):
-        """Log info only in development"""
-        if not IS_PRODUCTION:
-            print(*args, **kwargs, file=sys.stdout)
-    
+    def info(*args, exc_info=False, stack_info: bool = False):
+        """Log info only in development (INFO is below the production level)"""
+        _emit(logging.INFO, args, exc_info, stack_info)
+
     @staticmethod
-    def debug(*args, **kwargs):
-        """Log debug only in development"""
-        if not IS_PRODUCTION:
-            print('[DEBUG]', *args, **kwargs, file=sys.stdout)
-    
+    def debug(*args, exc_info=False, stack_info: bool = False):
+        """Log debug only when DEBUG is enabled"""
+        _emit(logging.DEBUG, args, exc_info, stack_info)
+
     @staticmethod
-    def exception(*args, **kwargs):
+    def exception(*args, exc_info=True, stack_info: bool = False):
         """Always log exceptions with full traceback (even in production)"""
-        import datetime
-        timestamp = datetime.datetime.now().isoformat()
-        print(f"[EXCEPTION] {timestamp}", *args, **kwargs, file=sys.stderr)
-        print(f"[EXCEPTION] {timestamp}", *args, **kwargs, file=sys.stdout)
-        traceback.print_exc(file=sys.stderr)
-        traceback.print_exc(file=sys.stdout)
+        _emit(logging.ERROR, args, exc_info, stack_info)
 
 # Create singleton instance
 logger = Logger()
-
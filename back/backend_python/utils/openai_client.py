@@ -0,0 +1,41 @@
+"""
+Shared OpenAI client.
+
+One AsyncOpenAI instance (and its httpx connection pool) is reused by every
+helper so TCP/TLS setup to api.openai.com is paid once per worker, not per call.
+The pool size doubles as the concurrency cap (OPENAI_MAX_CONCURRENCY): bursts
+queue locally for a connection instead of all hitting OpenAI and drawing 429s.
+A queued call gives up after OPENAI_TIMEOUT_SECONDS without a free connection,
+so a burst fails fast instead of hanging.
+"""
+
+from functools import lru_cache
+
+import httpx
+from openai import AsyncOpenAI
+
+from config import settings
+
+
+_PLACEHOLDER_KEYS = ("sk-placeholder", "sk_placeholder")
+
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> AsyncOpenAI:
+    api_key = settings.openai_api_key
+    if not api_key or api_key.lower().startswith(_PLACEHOLDER_KEYS):
+        raise ValueError(
+            "OpenAI API key is not configured. Please set OPENAI_API_KEY in your .env file. "
+            "Get your API key from https://platform.openai.com/api-keys"
+        )
+    return AsyncOpenAI(
+        api_key=api_key,
+        max_retries=settings.openai_max_retries,
+        timeout=httpx.Timeout(settings.openai_timeout_s),
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.openai_max_concurrency,
+                max_keepalive_connections=settings.openai_max_concurrency,
+            ),
+        ),
+    )
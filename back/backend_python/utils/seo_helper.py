@@ -11,14 +11,16 @@ SEO reports are generated from what we crawl and AI research:
 
 import os
 import asyncio
+import copy
+import hashlib
 import json
 import re
+from collections import OrderedDict
 from typing import Optional, List, Dict, Any
 from urllib.parse import urlparse, urljoin
 
 import aiohttp
-from dotenv import load_dotenv
-from openai import AsyncOpenAI
+import orjson
 
 from utils.web_crawler import (
     crawl_and_extract,
@@ -28,24 +30,17 @@ from utils.web_crawler import (
     discover_related_sites,
     extract_keywords_from_content,
     compute_keyword_gaps,
+    read_text_capped,
 )
 
 from utils.brand_visibility_helper import (
     get_brand_visibility_data,
     format_brand_visibility_data_for_prompt,
 )
-
-load_dotenv()
-
-
-def get_openai_client() -> AsyncOpenAI:
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key or api_key == "sk-placeholder" or api_key.startswith("sk-placeholder"):
-        raise ValueError(
-            "OpenAI API key is not configured. Please set OPENAI_API_KEY in your .env file. "
-            "Get your API key from https://platform.openai.com/api-keys"
-        )
-    return AsyncOpenAI(api_key=api_key)
+from utils.openai_client import get_openai_client
+from utils.cache import async_ttl_cache
+from utils.http_client import get_http_session
+from utils.text import _evidence_json, count_words, extract_sentences, normalize_url, truncate_text
 
 
 _DEFAULT_HEADERS = {
@@ -81,8 +76,13 @@ async def _fetch(
     allow_redirects: bool = True,
 ) -> Dict[str, Any]:
     try:
-        async with session.get(url, timeout=timeout_s, allow_redirects=allow_redirects) as resp:
-            text = await resp.text(errors="ignore")
+        async with session.get(
+            url,
+            headers=_DEFAULT_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=timeout_s),
+            allow_redirects=allow_redirects,
+        ) as resp:
+            text = await read_text_capped(resp)
             return {
                 "url": url,
                 "final_url": str(resp.url),
@@ -101,43 +101,54 @@ async def _fetch(
         }
 
 
+# <head> signal patterns, compiled once (run on every technical-evidence fetch)
+_HEAD_RE = re.compile(r"<head\b[^>]*>(.*?)</head>", re.IGNORECASE | re.DOTALL)
+_CANONICAL_RE = re.compile(r'<link[^>]+rel=["\']canonical["\'][^>]+href=["\']([^"\']+)["\']', re.IGNORECASE | re.DOTALL)
+_META_ROBOTS_RE = re.compile(r'<meta[^>]+name=["\']robots["\'][^>]+content=["\']([^"\']+)["\']', re.IGNORECASE | re.DOTALL)
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_OG_TITLE_RE = re.compile(r'<meta[^>]+property=["\']og:title["\']', re.IGNORECASE)
+_OG_DESC_RE = re.compile(r'<meta[^>]+property=["\']og:description["\']', re.IGNORECASE)
+_OG_IMAGE_RE = re.compile(r'<meta[^>]+property=["\']og:image["\']', re.IGNORECASE)
+_TWITTER_CARD_RE = re.compile(r'<meta[^>]+name=["\']twitter:card["\']', re.IGNORECASE)
+_HREFLANG_RE = re.compile(
+    r'<link[^>]+rel=["\']alternate["\'][^>]+hreflang=["\']([^"\']+)["\'][^>]+href=["\']([^"\']+)["\']',
+    re.IGNORECASE,
+)
+_LD_JSON_RE = re.compile(
+    r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL,
+)
+
+
 def _extract_head_signals(html: str) -> Dict[str, Any]:
     if not html:
         return {}
 
     head = html
-    m = re.search(r"<head\b[^>]*>(.*?)</head>", html, flags=re.IGNORECASE | re.DOTALL)
+    m = _HEAD_RE.search(html)
     if m:
         head = m.group(1)
 
-    def _first(pattern: str) -> str:
-        mm = re.search(pattern, head, flags=re.IGNORECASE | re.DOTALL)
+    def _first(pattern: "re.Pattern[str]") -> str:
+        mm = pattern.search(head)
         return (mm.group(1).strip() if mm and mm.group(1) else "")[:500]
 
-    canonical = _first(r'<link[^>]+rel=["\']canonical["\'][^>]+href=["\']([^"\']+)["\']')
-    meta_robots = _first(r'<meta[^>]+name=["\']robots["\'][^>]+content=["\']([^"\']+)["\']')
-    title = _first(r"<title[^>]*>(.*?)</title>")
+    canonical = _first(_CANONICAL_RE)
+    meta_robots = _first(_META_ROBOTS_RE)
+    title = _first(_TITLE_RE)
 
-    has_og_title = bool(re.search(r'<meta[^>]+property=["\']og:title["\']', head, flags=re.IGNORECASE))
-    has_og_desc = bool(re.search(r'<meta[^>]+property=["\']og:description["\']', head, flags=re.IGNORECASE))
-    has_og_image = bool(re.search(r'<meta[^>]+property=["\']og:image["\']', head, flags=re.IGNORECASE))
-    has_twitter_card = bool(re.search(r'<meta[^>]+name=["\']twitter:card["\']', head, flags=re.IGNORECASE))
+    has_og_title = bool(_OG_TITLE_RE.search(head))
+    has_og_desc = bool(_OG_DESC_RE.search(head))
+    has_og_image = bool(_OG_IMAGE_RE.search(head))
+    has_twitter_card = bool(_TWITTER_CARD_RE.search(head))
 
     hreflangs: List[Dict[str, str]] = []
-    for mm in re.finditer(
-        r'<link[^>]+rel=["\']alternate["\'][^>]+hreflang=["\']([^"\']+)["\'][^>]+href=["\']([^"\']+)["\']',
-        head,
-        flags=re.IGNORECASE,
-    ):
+    for mm in _HREFLANG_RE.finditer(head):
         hreflangs.append({"hreflang": mm.group(1)[:30], "href": mm.group(2)[:400]})
     hreflangs = hreflangs[:25]
 
     schema_types: List[str] = []
-    for mm in re.finditer(
-        r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
-        head,
-        flags=re.IGNORECASE | re.DOTALL,
-    ):
+    for mm in _LD_JSON_RE.finditer(head):
         raw = mm.group(1).strip()
         try:
             parsed = json.loads(raw)
@@ -204,44 +215,29 @@ async def _fetch_robots_and_sitemap(session: aiohttp.ClientSession, root_url: st
 
 
 async def collect_technical_evidence(normalized_url: str) -> Dict[str, Any]:
-    async with aiohttp.ClientSession(headers=_DEFAULT_HEADERS) as session:
-        home = await _fetch(session, normalized_url, timeout_s=18.0)
-        head_signals = _extract_head_signals(home.get("text", ""))
-        robots_and_sitemap = await _fetch_robots_and_sitemap(session, normalized_url)
-
-        return {
-            "homepage_fetch": {
-                "url": home.get("url"),
-                "final_url": home.get("final_url"),
-                "status": home.get("status"),
-                "headers": home.get("headers", {}),
-            },
-            "head_signals": head_signals,
-            "robots_and_sitemap": robots_and_sitemap,
-        }
-
-
-def _truncate_text(text: str, max_chars: int) -> str:
-    if not text:
-        return ""
-    if len(text) <= max_chars:
-        return text
-    return text[: max_chars - 3].rstrip() + "..."
+    session = get_http_session()
+    home = await _fetch(session, normalized_url, timeout_s=18.0)
+    head_signals = _extract_head_signals(home.get("text", ""))
+    robots_and_sitemap = await _fetch_robots_and_sitemap(session, normalized_url)
 
-
-def _extract_sentences(text: str, max_sentences: int = 3) -> List[str]:
-    if not text:
-        return []
-    sentences = re.split(r"(?<=[.!?])\s+", text.strip())
-    return [s.strip() for s in sentences if s.strip()][:max_sentences]
+    return {
+        "homepage_fetch": {
+            "url": home.get("url"),
+            "final_url": home.get("final_url"),
+            "status": home.get("status"),
+            "headers": home.get("headers", {}),
+        },
+        "head_signals": head_signals,
+        "robots_and_sitemap": robots_and_sitemap,
+    }
 
 
 def _extract_quotes(text_sources: List[str], source_url: str, max_quotes: int = 3) -> List[Dict[str, str]]:
     quotes: List[Dict[str, str]] = []
     combined = " ".join([t for t in text_sources if t])
-    for sentence in _extract_sentences(combined, max_sentences=max_quotes * 2):
+    for sentence in extract_sentences(combined, max_sentences=max_quotes * 2):
         if len(sentence) >= 40:
-            quotes.append({"quote": _truncate_text(sentence, 220), "source": source_url})
+            quotes.append({"quote": truncate_text(sentence, 220), "source": source_url})
         if len(quotes) >= max_quotes:
             break
     return quotes
@@ -272,14 +268,14 @@ def _build_site_evidence(data: Optional[Dict[str, Any]], fallback_url: str) -> D
     url = data.get("url") or fallback_url
     return {
         "url": url,
-        "title": _truncate_text(data.get("title", ""), 160),
-        "description": _truncate_text(data.get("description", ""), 400),
-        "h1": _truncate_text(data.get("h1", ""), 200),
+        "title": truncate_text(data.get("title", ""), 160),
+        "description": truncate_text(data.get("description", ""), 400),
+        "h1": truncate_text(data.get("h1", ""), 200),
         "headings": (data.get("headings") or [])[:10],
         "features": (data.get("features") or [])[:12],
         "internal_link_count": int(data.get("internal_link_count") or 0),
         "internal_links": (data.get("internal_links") or [])[:8],
-        "content_excerpt": _truncate_text(data.get("content", ""), 1200),
+        "content_excerpt": truncate_text(data.get("content", ""), 1200),
         "quotes": _extract_quotes(text_sources, url, max_quotes=3),
     }
 
@@ -371,8 +367,11 @@ def _dedupe_case(items: List[str], max_items: int = 20) -> List[str]:
     return out
 
 
+_SLUG_SEP_RE = re.compile(r"[^a-z0-9]+")
+
+
 def _slugify_keyword(keyword: str, max_len: int = 60) -> str:
-    slug = re.sub(r"[^a-z0-9]+", "-", (keyword or "").lower()).strip("-")
+    slug = _SLUG_SEP_RE.sub("-", (keyword or "").lower()).strip("-")
     if len(slug) > max_len:
         slug = slug[:max_len].rstrip("-")
     return slug
@@ -512,6 +511,52 @@ def _filter_brand_visibility_evidence(items: List[Dict[str, Any]], max_items: in
     return cleaned
 
 
+# Kept free of per-request values so the prefix is identical on every call
+# (lets OpenAI prompt caching reuse it); focus areas, business type and
+# language go in the user message.
+_SEO_SYSTEM_PROMPT = """You are an expert SEO consultant with deep knowledge of search engine optimization, technical SEO, content strategy, and digital marketing.
+
+Use AI research to enrich the report: combine your knowledge (SEO best practices, benchmarks for this business type, typical competitor tactics, ranking and conversion norms) with the crawled site and competitor data. In this AI era we always provide actionable advice—when data is missing, use research to suggest concrete next steps (e.g. typical meta length, common schema for this industry) rather than leaving gaps.
+
+CRITICAL REQUIREMENTS:
+1. PRODUCT SPECIFIC ANALYSIS
+Use the crawled data and competitor data from the summary; use AI research to inform recommendations where it adds value.
+
+2. EVIDENCE SOURCES — match evidence to each focus area
+Crawled page: title, meta description, H1, headings, content, internal links, features → use for On-Page, Content, structure, Accessibility.
+Competitor crawl → use for competitor and positioning.
+Keyword rankings, brand visibility → when present.
+For Technical SEO focus only: robots.txt, sitemap, schema, headers. For other focus areas use the crawl; do not default to technical.
+
+3. SITE-SPECIFIC, SHOW ACTUAL DATA (NO GENERIC TEMPLATE)
+- Every section must mention the website being reviewed (by URL or name). For each section use the data that fits the focus (On-Page/Content → crawl; Technical → robots/sitemap/schema; etc.). Show real values. Do not use the word "evidence" in the report — use "On the page:", "Current state:", "Not present on the website", "Missing on the page".
+- For each finding: state the current value, explain what is wrong or missing, and what to do (e.g. "Current title 'X'; change to 'Y' under 60 chars").
+- Match data to the focus area; do not default to technical when the section is On-Page, Content, or Accessibility.
+
+4. READER-FRIENDLY LANGUAGE — do not use the word "evidence" in the report
+When something is missing on the website, say "Not present on the website" or "Missing on the page" — never "Not available in evidence". When citing what is on the page, use "On the page:" or "Current state:" (e.g. "On the page: meta description missing. Recommend: add under 160 characters."). Do not invent data; when data is missing, still be actionable with a concrete next step.
+
+4b. MARKDOWN FORMATTING — no code-block style for normal text
+Do not indent normal sentences with 4 or more spaces (that becomes a code block and looks broken). For subsections such as Keywords, Extracted Keywords, Content Gaps, use clear markdown instead:
+- Use **Keywords:** or **Extracted Keywords:** or **Content Gaps:** as a bold label on its own line, then the value on the next line (or same line after a space). No leading spaces before the label.
+- Or use a bullet list: "- **Keywords:** No keywords currently ranking..."
+- Never output lines like "    Keywords: ..." (leading spaces) — use "**Keywords:** ..." or "- **Keywords:** ..." so the report renders correctly.
+
+5. SECTION QUALITY RULE (ACTIONABLE, SITE-SPECIFIC)
+Recommendations must be actionable. Use the crawled data per focus and AI research (best practices, benchmarks) to inform fixes. Show the real value and the fix. If data for a section is thin, use your knowledge to give a concrete next step (e.g. "Run PageSpeed for [URL]" or "Add FAQ schema using this pattern") so the user always has something to act on.
+
+6. DEPTH & STRATEGY RULE
+Use strategy evidence when present to produce a keyword-to-page plan and priorities. If strategy evidence is empty, use AI research (typical keywords and content structure for this business type) to suggest a keyword-to-page plan and what to collect so the user has actionable next steps.
+
+7. EXECUTION RULE
+Include specific page ideas (slugs + titles), internal linking targets, and meta updates grounded in evidence. When keyword/ranking data is missing, use the crawled site to recommend many options (e.g. 10–15+ keyword themes and matching slugs/titles). For Implementation Roadmap: it must address every selected focus area—for each section that appears in the report (Technical, On-Page, Content, Off-Page, Local, Mobile, Page Speed, Accessibility, Competitor Keyword Analysis when present), include at least one concrete roadmap step that captures that section's recommendations, so no recommendation from the selected SEO options is left out. Use the crawled website and tie each step to this site's URLs or product — never generic lines like "Conduct keyword analysis" or "Develop a content calendar" without specifics.
+
+FOCUS AREAS
+The user message lists the selected focus areas, business type, and language.
+You MUST include a dedicated section for EACH selected focus area (technical, on-page, content, off-page, local, mobile, speed, accessibility). Every section listed in the required section order must be filled with detailed, actionable analysis—do not skip or merge focus areas. Local SEO, Page Speed, Off-Page, and Mobile each get their own full section when selected.
+Write the report in the requested language."""
+
+
 async def generate_seo_report(
     website_url: str,
     business_type: str = "saas",
@@ -530,10 +575,7 @@ async def generate_seo_report(
     if focus_areas is None:
         focus_areas = ["on-page", "technical", "content"]
 
-    normalized_url = website_url.strip()
-    if not normalized_url.startswith(("http://", "https://")):
-        normalized_url = f"https://{normalized_url}"
-    normalized_url = normalized_url.rstrip("/")
+    normalized_url = normalize_url(website_url)
 
     crawled_data: Optional[Dict[str, Any]] = None
     keyword_rankings_data: Optional[Dict[str, Any]] = None
@@ -585,11 +627,9 @@ async def generate_seo_report(
     normalized_competitor_urls: List[str] = []
     if competitor_urls:
         for u in competitor_urls:
-            uu = (u or "").strip()
+            uu = normalize_url(u)
             if uu and uu not in normalized_competitor_urls:
-                if not uu.startswith(("http://", "https://")):
-                    uu = f"https://{uu}"
-                normalized_competitor_urls.append(uu.rstrip("/"))
+                normalized_competitor_urls.append(uu)
     try:
         competitor_keywords_data = await get_competitor_high_volume_keywords(
             website_url=normalized_url,
@@ -755,56 +795,16 @@ async def generate_seo_report(
         "brand_visibility_evidence": brand_visibility_evidence,
     }
 
-    evidence_json = json.dumps(evidence_summary, ensure_ascii=True, indent=2)
+    evidence_json = _evidence_json(evidence_summary)
 
     focus_areas_text = ", ".join(focus_areas)
 
-    system_prompt = f"""You are an expert SEO consultant with deep knowledge of search engine optimization, technical SEO, content strategy, and digital marketing.
-
-Use AI research to enrich the report: combine your knowledge (SEO best practices, benchmarks for this business type, typical competitor tactics, ranking and conversion norms) with the crawled site and competitor data. In this AI era we always provide actionable advice—when data is missing, use research to suggest concrete next steps (e.g. typical meta length, common schema for this industry) rather than leaving gaps.
-
-CRITICAL REQUIREMENTS:
-1. PRODUCT SPECIFIC ANALYSIS
-Use the crawled data and competitor data from the summary; use AI research to inform recommendations where it adds value.
-
-2. EVIDENCE SOURCES — match evidence to each focus area
-Crawled page: title, meta description, H1, headings, content, internal links, features → use for On-Page, Content, structure, Accessibility.
-Competitor crawl → use for competitor and positioning.
-Keyword rankings, brand visibility → when present.
-For Technical SEO focus only: robots.txt, sitemap, schema, headers. For other focus areas use the crawl; do not default to technical.
-
-3. SITE-SPECIFIC, SHOW ACTUAL DATA (NO GENERIC TEMPLATE)
-- Every section must mention the website being reviewed (by URL or name). For each section use the data that fits the focus (On-Page/Content → crawl; Technical → robots/sitemap/schema; etc.). Show real values. Do not use the word "evidence" in the report — use "On the page:", "Current state:", "Not present on the website", "Missing on the page".
-- For each finding: state the current value, explain what is wrong or missing, and what to do (e.g. "Current title 'X'; change to 'Y' under 60 chars").
-- Match data to the focus area; do not default to technical when the section is On-Page, Content, or Accessibility.
-
-4. READER-FRIENDLY LANGUAGE — do not use the word "evidence" in the report
-When something is missing on the website, say "Not present on the website" or "Missing on the page" — never "Not available in evidence". When citing what is on the page, use "On the page:" or "Current state:" (e.g. "On the page: meta description missing. Recommend: add under 160 characters."). Do not invent data; when data is missing, still be actionable with a concrete next step.
-
-4b. MARKDOWN FORMATTING — no code-block style for normal text
-Do not indent normal sentences with 4 or more spaces (that becomes a code block and looks broken). For subsections such as Keywords, Extracted Keywords, Content Gaps, use clear markdown instead:
-- Use **Keywords:** or **Extracted Keywords:** or **Content Gaps:** as a bold label on its own line, then the value on the next line (or same line after a space). No leading spaces before the label.
-- Or use a bullet list: "- **Keywords:** No keywords currently ranking..."
-- Never output lines like "    Keywords: ..." (leading spaces) — use "**Keywords:** ..." or "- **Keywords:** ..." so the report renders correctly.
-
-5. SECTION QUALITY RULE (ACTIONABLE, SITE-SPECIFIC)
-Recommendations must be actionable. Use the crawled data per focus and AI research (best practices, benchmarks) to inform fixes. Show the real value and the fix. If data for a section is thin, use your knowledge to give a concrete next step (e.g. "Run PageSpeed for [URL]" or "Add FAQ schema using this pattern") so the user always has something to act on.
-
-6. DEPTH & STRATEGY RULE
-Use strategy evidence when present to produce a keyword-to-page plan and priorities. If strategy evidence is empty, use AI research (typical keywords and content structure for this business type) to suggest a keyword-to-page plan and what to collect so the user has actionable next steps.
-
-7. EXECUTION RULE
-Include specific page ideas (slugs + titles), internal linking targets, and meta updates grounded in evidence. When keyword/ranking data is missing, use the crawled site to recommend many options (e.g. 10–15+ keyword themes and matching slugs/titles). For Implementation Roadmap: it must address every selected focus area—for each section that appears in the report (Technical, On-Page, Content, Off-Page, Local, Mobile, Page Speed, Accessibility, Competitor Keyword Analysis when present), include at least one concrete roadmap step that captures that section's recommendations, so no recommendation from the selected SEO options is left out. Use the crawled website and tie each step to this site's URLs or product — never generic lines like "Conduct keyword analysis" or "Develop a content calendar" without specifics.
-
-Focus Areas: {focus_areas_text}
-You MUST include a dedicated section for EACH selected focus area (technical, on-page, content, off-page, local, mobile, speed, accessibility). Every section listed in the required section order must be filled with detailed, actionable analysis—do not skip or merge focus areas. Local SEO, Page Speed, Off-Page, and Mobile each get their own full section when selected.
-Business Type: {business_type}
-Language: {language}"""
-
     user_prompt = f"""Analyze the website and return an SEO report. Use the crawled data and competitor data below, plus AI research (best practices, benchmarks for this business type), to provide actionable advice in every section. There is no reason to leave the user without something to act on.
 
 Website URL: {normalized_url}
 Business Type: {business_type}
+Focus Areas: {focus_areas_text}
+Language: {language}
 
 {f"Target Keywords: {target_keywords}" if target_keywords else ""}
 {f"Known Issues: {current_seo_issues}" if current_seo_issues else ""}
@@ -893,7 +893,7 @@ Implementation Roadmap: must address every selected focus area—for each sectio
         },
     }
 
-    messages = [{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}]
+    messages = [{"role": "system", "content": _SEO_SYSTEM_PROMPT}, {"role": "user", "content": user_prompt}]
 
     max_attempts = 3
     max_tokens = 3500
@@ -911,8 +911,8 @@ Implementation Roadmap: must address every selected focus area—for each sectio
         )
         raw_report = response.choices[0].message.content.strip()
         try:
-            report_json = json.loads(raw_report)
-        except json.JSONDecodeError:
+            report_json = orjson.loads(raw_report)
+        except orjson.JSONDecodeError:
             report_json = None
 
         if report_json:
@@ -1059,12 +1059,10 @@ async def generate_ai_optimized_recommendations(
             urls_to_try = competitor_urls or await _get_top_competitor_urls_for_site(website_url, business_type)
             for first_url in (urls_to_try or [])[:1]:
                 try:
-                    normalized = first_url.strip()
-                    if not normalized.startswith(("http://", "https://")):
-                        normalized = f"https://{normalized}"
+                    normalized = normalize_url(first_url)
                     competitor_crawl_data = await crawl_and_extract(normalized, use_js_render=use_js_render)
                     if competitor_crawl_data:
-                        competitor_crawl_data["url"] = normalized.rstrip("/")
+                        competitor_crawl_data["url"] = normalized
                         break
                 except Exception:
                     continue
@@ -1172,6 +1170,7 @@ Repeat for every extracted roadmap and section recommendation. Then add the fina
         return f"# Error Generating Action Points\n\nError: {str(e)}"
 
 
+@async_ttl_cache(ttl=6 * 3600)
 async def _get_top_competitor_urls_for_site(
     website_url: str,
     business_type: str = "saas",
@@ -1234,18 +1233,53 @@ Original Content:
         return f"Error rewriting content: {str(e)}"
 
 
+_QA_MIN_WORDS = int(os.getenv("SEO_QA_MIN_WORDS", "1200"))
+_QA_MAX_WORDS = int(os.getenv("SEO_QA_MAX_WORDS", "3500"))
+
+# QA results keyed by (report digest, focus areas, competitor flag): exactly the
+# inputs the check reads. The check is pure, so a retried create or a
+# /quality-check of a report we just generated is a dict lookup instead of
+# another scan of the report. Hits are deep copies, so callers never share
+# the cached issues list.
+_QA_CACHE_MAX = 512
+_qa_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
+
 def quality_assurance_check(
     report: str,
     website_url: str,
     focus_areas: Optional[List[str]] = None,
     focus_on_competitor_analysis: bool = False,
 ) -> Dict[str, Any]:
+    key = (
+        hashlib.blake2b(report.encode("utf-8"), digest_size=16).digest(),
+        tuple(focus_areas) if focus_areas else None,
+        focus_on_competitor_analysis,
+    )
+    cached = _qa_cache.get(key)
+    if cached is not None:
+        _qa_cache.move_to_end(key)
+        return copy.deepcopy(cached)
+
+    result = _quality_assurance_check(report, focus_areas, focus_on_competitor_analysis)
+    _qa_cache[key] = result
+    if len(_qa_cache) > _QA_CACHE_MAX:
+        _qa_cache.popitem(last=False)
+    return copy.deepcopy(result)
+
+
+def _quality_assurance_check(
+    report: str,
+    focus_areas: Optional[List[str]],
+    focus_on_competitor_analysis: bool,
+) -> Dict[str, Any]:
+    report_lower = report.lower()
     issues: List[str] = []
     quality_score = 100
 
-    word_count = len(report.split())
-    qa_min_words = int(os.getenv("SEO_QA_MIN_WORDS", "1200"))
-    qa_max_words = int(os.getenv("SEO_QA_MAX_WORDS", "3500"))
+    word_count = count_words(report)
+    qa_min_words = _QA_MIN_WORDS
+    qa_max_words = _QA_MAX_WORDS
     if word_count < qa_min_words:
         issues.append(f"Report is too short (less than {qa_min_words} words)")
         quality_score -= 20
@@ -1255,7 +1289,7 @@ def quality_assurance_check(
 
     if focus_on_competitor_analysis:
         required_sections = ["Executive Summary", "Competitor Keyword Analysis"]
-        found_sections = sum(1 for section in required_sections if section.lower() in report.lower())
+        found_sections = sum(1 for section in required_sections if section.lower() in report_lower)
         if found_sections < len(required_sections):
             issues.append(f"Missing required competitor analysis sections (found {found_sections}/{len(required_sections)})")
             quality_score -= 30
@@ -1288,24 +1322,24 @@ def quality_assurance_check(
 
         required_sections.append("Competitor Keyword Analysis & Meta-Tag Optimization")
 
-        found_sections = sum(1 for section in required_sections if section.lower() in report.lower())
+        found_sections = sum(1 for section in required_sections if section.lower() in report_lower)
         if found_sections < len(required_sections) * 0.7:
             issues.append(f"Missing key sections (found {found_sections}/{len(required_sections)})")
             quality_score -= 15
 
         if "on-page" in focus_areas:
-            if "meta" not in report.lower() and "title tag" not in report.lower():
+            if "meta" not in report_lower and "title tag" not in report_lower:
                 issues.append("Missing meta tag recommendations")
                 quality_score -= 10
         if "technical" in focus_areas:
-            if "schema" not in report.lower():
+            if "schema" not in report_lower:
                 issues.append("Missing schema markup recommendations")
                 quality_score -= 5
         if "content" in focus_areas or "on-page" in focus_areas:
-            if "keyword" not in report.lower():
+            if "keyword" not in report_lower:
                 issues.append("Missing keyword analysis")
                 quality_score -= 15
-        if "competitor keyword analysis" not in report.lower():
+        if "competitor keyword analysis" not in report_lower:
             issues.append("Missing competitor analysis")
             quality_score -= 5
 
@@ -1313,11 +1347,11 @@ def quality_assurance_check(
     focus_areas = focus_areas or ["on-page", "technical", "content"]
     return {
         "word_count": word_count,
-        "sections_found": sum(1 for section in (required_sections if not focus_on_competitor_analysis else ["Executive Summary", "Competitor"]) if section.lower() in report.lower()),
-        "has_meta_tags": False if focus_on_competitor_analysis or "on-page" not in focus_areas else ("meta" in report.lower() or "title tag" in report.lower()),
-        "has_schema": False if focus_on_competitor_analysis or "technical" not in focus_areas else ("schema" in report.lower()),
-        "has_keywords": False if focus_on_competitor_analysis or ("content" not in focus_areas and "on-page" not in focus_areas) else ("keyword" in report.lower()),
-        "has_competitor_analysis": "competitor" in report.lower(),
+        "sections_found": sum(1 for section in (required_sections if not focus_on_competitor_analysis else ["Executive Summary", "Competitor"]) if section.lower() in report_lower),
+        "has_meta_tags": False if focus_on_competitor_analysis or "on-page" not in focus_areas else ("meta" in report_lower or "title tag" in report_lower),
+        "has_schema": False if focus_on_competitor_analysis or "technical" not in focus_areas else ("schema" in report_lower),
+        "has_keywords": False if focus_on_competitor_analysis or ("content" not in focus_areas and "on-page" not in focus_areas) else ("keyword" in report_lower),
+        "has_competitor_analysis": "competitor" in report_lower,
         "quality_score": quality_score,
         "issues": issues,
         "status": "excellent" if quality_score >= 90 else "good" if quality_score >= 70 else "needs_improvement",
@@ -0,0 +1,72 @@
+"""
+Text and URL helpers shared by the route and helper modules.
+"""
+
+import re
+from itertools import islice
+from typing import Any, Iterator, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+import orjson
+
+_WORD_RE = re.compile(r"\S+")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def count_words(text: str) -> int:
+    """Count words in text (regex scan in C, no intermediate token list)"""
+    return sum(1 for _ in _WORD_RE.finditer(text or ""))
+
+
+def estimate_read_time(word_count: int) -> int:
+    """Estimate reading time in minutes (average 200 words per minute)"""
+    return max(1, round(word_count / 200))
+
+
+def normalize_url(u: Optional[str]) -> str:
+    """Normalize a user-entered URL ("" if blank): default to https, lowercase scheme/host, drop trailing slash, query and fragment"""
+    u = (u or "").strip()
+    if not u:
+        return ""
+    if u.startswith("//"):
+        u = "https:" + u
+    elif not u.lower().startswith(("http://", "https://")):
+        u = "https://" + u
+    p = urlsplit(u)
+    return urlunsplit((p.scheme.lower(), p.netloc.lower(), p.path.rstrip("/"), "", ""))
+
+
+def truncate_text(text: str, max_chars: int) -> str:
+    """Clip text to max_chars, ending with "..." when cut"""
+    if not text:
+        return ""
+    if len(text) <= max_chars:
+        return text
+    return text[: max_chars - 3].rstrip() + "..."
+
+
+def _iter_sentences(text: str) -> Iterator[str]:
+    """Lazily yield the non-empty sentences of text (split after . ! or ?)"""
+    text = (text or "").strip()
+    start = 0
+    for m in _SENTENCE_SPLIT_RE.finditer(text):
+        sentence = text[start : m.start()].strip()
+        if sentence:
+            yield sentence
+        start = m.end()
+    sentence = text[start:].strip()
+    if sentence:
+        yield sentence
+
+
+def extract_sentences(text: str, max_sentences: int = 3) -> List[str]:
+    """First max_sentences non-empty sentences of text (stops scanning once found)"""
+    return list(islice(_iter_sentences(text), max_sentences))
+
+
+def _evidence_json(obj: Any) -> str:
+    """Evidence block for a report prompt as compact, non-escaped JSON
+
+    The model does not need indentation or \\uXXXX escapes, and both cost prompt tokens.
+    """
+    return orjson.dumps(obj).decode()
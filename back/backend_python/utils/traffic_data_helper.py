@@ -1,16 +1,19 @@
 """
 Traffic Data Helper - Fetches real traffic data from SimilarWeb API and other sources
 """
-import os
+import logging
 import aiohttp
+import orjson
 from typing import Optional, Dict, Any, List
-from dotenv import load_dotenv
 from urllib.parse import urlparse
 
-load_dotenv()
+from config import settings
+from utils.http_client import get_http_session
+
+log = logging.getLogger(__name__)
 
 # SimilarWeb API configuration
-SIMILARWEB_API_KEY = os.getenv("SIMILARWEB_API_KEY")
+SIMILARWEB_API_KEY = settings.similarweb_api_key
 SIMILARWEB_API_BASE = "https://api.similarweb.com/v1/website"
 
 
@@ -36,64 +39,64 @@ async def get_similarweb_traffic_data(domain: str) -> Optional[Dict[str, Any]]:
         # Remove www. prefix
         domain = domain.replace('www.', '').strip()
         
-        async with aiohttp.ClientSession() as session:
-            # SimilarWeb API endpoints
-            endpoints = {
-                'traffic': f"{SIMILARWEB_API_BASE}/{domain}/total-traffic-and-engagement/visits",
-                'sources': f"{SIMILARWEB_API_BASE}/{domain}/traffic-sources/overview",
-                'geography': f"{SIMILARWEB_API_BASE}/{domain}/geo/traffic-share",
-                'demographics': f"{SIMILARWEB_API_BASE}/{domain}/demographics/age",
-            }
+        session = get_http_session()
+        # SimilarWeb API endpoints
+        endpoints = {
+            'traffic': f"{SIMILARWEB_API_BASE}/{domain}/total-traffic-and-engagement/visits",
+            'sources': f"{SIMILARWEB_API_BASE}/{domain}/traffic-sources/overview",
+            'geography': f"{SIMILARWEB_API_BASE}/{domain}/geo/traffic-share",
+            'demographics': f"{SIMILARWEB_API_BASE}/{domain}/demographics/age",
+        }
             
-            traffic_data = {}
+        traffic_data = {}
             
-            # Fetch traffic data
-            try:
-                url = f"{endpoints['traffic']}?api_key={SIMILARWEB_API_KEY}&start_date=2024-01&end_date=2024-12&granularity=monthly&main_domain_only=false&format=json"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if 'visits' in data:
-                            # Get latest month data
-                            visits = data.get('visits', [])
-                            if visits:
-                                latest = visits[-1] if isinstance(visits, list) else visits
-                                traffic_data['monthly_visits'] = latest.get('visits') if isinstance(latest, dict) else latest
-                                traffic_data['traffic_trend'] = 'increasing' if len(visits) > 1 and visits[-1] > visits[0] else 'stable'
-            except Exception as e:
-                print(f"Error fetching SimilarWeb traffic: {e}")
+        # Fetch traffic data
+        try:
+            url = f"{endpoints['traffic']}?api_key={SIMILARWEB_API_KEY}&start_date=2024-01&end_date=2024-12&granularity=monthly&main_domain_only=false&format=json"
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    if 'visits' in data:
+                        # Get latest month data
+                        visits = data.get('visits', [])
+                        if visits:
+                            latest = visits[-1] if isinstance(visits, list) else visits
+                            traffic_data['monthly_visits'] = latest.get('visits') if isinstance(latest, dict) else latest
+                            traffic_data['traffic_trend'] = 'increasing' if len(visits) > 1 and visits[-1] > visits[0] else 'stable'
+        except Exception as e:
+            log.warning("Error fetching SimilarWeb traffic: %s", e)
             
-            # Fetch traffic sources
-            try:
-                url = f"{endpoints['sources']}?api_key={SIMILARWEB_API_KEY}&start_date=2024-01&end_date=2024-12&main_domain_only=false&format=json"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        traffic_data['traffic_sources'] = {
-                            'organic': data.get('organic_search', {}).get('value', 0),
-                            'direct': data.get('direct', {}).get('value', 0),
-                            'referral': data.get('referrals', {}).get('value', 0),
-                            'social': data.get('social', {}).get('value', 0),
-                            'paid': data.get('paid_search', {}).get('value', 0),
-                        }
-            except Exception as e:
-                print(f"Error fetching SimilarWeb sources: {e}")
+        # Fetch traffic sources
+        try:
+            url = f"{endpoints['sources']}?api_key={SIMILARWEB_API_KEY}&start_date=2024-01&end_date=2024-12&main_domain_only=false&format=json"
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    traffic_data['traffic_sources'] = {
+                        'organic': data.get('organic_search', {}).get('value', 0),
+                        'direct': data.get('direct', {}).get('value', 0),
+                        'referral': data.get('referrals', {}).get('value', 0),
+                        'social': data.get('social', {}).get('value', 0),
+                        'paid': data.get('paid_search', {}).get('value', 0),
+                    }
+        except Exception as e:
+            log.warning("Error fetching SimilarWeb sources: %s", e)
             
-            # Fetch geographic data
-            try:
-                url = f"{endpoints['geography']}?api_key={SIMILARWEB_API_KEY}&start_date=2024-01&end_date=2024-12&country=US&format=json"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if 'countries' in data:
-                            traffic_data['top_countries'] = data['countries'][:5]  # Top 5 countries
-            except Exception as e:
-                print(f"Error fetching SimilarWeb geography: {e}")
+        # Fetch geographic data
+        try:
+            url = f"{endpoints['geography']}?api_key={SIMILARWEB_API_KEY}&start_date=2024-01&end_date=2024-12&country=US&format=json"
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    if 'countries' in data:
+                        traffic_data['top_countries'] = data['countries'][:5]  # Top 5 countries
+        except Exception as e:
+            log.warning("Error fetching SimilarWeb geography: %s", e)
             
-            return traffic_data if traffic_data else None
+        return traffic_data if traffic_data else None
             
     except Exception as e:
-        print(f"Error in SimilarWeb API call: {e}")
+        log.warning("Error in SimilarWeb API call: %s", e)
         return None
 
 
@@ -16,8 +16,12 @@ from typing import Optional, Dict, List, Any, Tuple
 from urllib.parse import urlparse, quote_plus, urljoin
 
 import aiohttp
+import orjson
 from bs4 import BeautifulSoup
 
+from utils.cache import async_ttl_cache
+from utils.http_client import get_http_session
+
 try:
     from playwright.async_api import async_playwright
     PLAYWRIGHT_AVAILABLE = True
@@ -26,6 +30,20 @@ except Exception:
     PLAYWRIGHT_AVAILABLE = False
 
 
+# Crawler env overrides, read once at import. Unset values fall back to the
+# per-call arguments.
+CRAWLER_HTTP_PROXY = os.getenv("CRAWLER_HTTP_PROXY") or None
+CRAWLER_MAX_RETRIES = os.getenv("CRAWLER_MAX_RETRIES")
+CRAWLER_TIMEOUT_SECONDS = os.getenv("CRAWLER_TIMEOUT_SECONDS")
+CRAWLER_JS_TIMEOUT_MS = os.getenv("CRAWLER_JS_TIMEOUT_MS")
+CRAWLER_ENABLE_JS_RENDER = os.getenv("CRAWLER_ENABLE_JS_RENDER", "false").lower() in ("1", "true", "yes", "y")
+# Successful crawls are reused for a few minutes: the SEO report and the
+# follow-up recommendations/meta-tag calls crawl the same site back to back.
+CRAWLER_CACHE_TTL_SECONDS = float(os.getenv("CRAWLER_CACHE_TTL_SECONDS", "300"))
+# Upper bound on bytes read from one response body; larger pages are truncated.
+CRAWLER_MAX_BYTES = int(os.getenv("CRAWLER_MAX_BYTES", str(5 * 1024 * 1024)))
+
+
 DEFAULT_USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 13_6) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15",
@@ -60,6 +78,48 @@ def _build_headers(user_agent: Optional[str] = None, url: str = "") -> Dict[str,
     return headers
 
 
+_HTML_SNIFF_CHARS = 4096
+_WS_RE = re.compile(r"\s+")
+_KEYWORD_TOKEN_RE = re.compile(r"\b[a-z0-9]{4,}\b")
+
+
+def _sniff_html(text: Optional[str]) -> bool:
+    # The <html> tag sits right after the doctype/comments, so only the head of
+    # the body needs checking (avoids lowercasing multi-MB documents).
+    return bool(text) and "<html" in text[:_HTML_SNIFF_CHARS].lower()
+
+
+_READ_CHUNK_BYTES = 64 * 1024
+
+# Content types that can never be a crawlable page (mislabeled HTML still gets
+# sniffed, so text/plain and application/octet-stream are not listed).
+_NON_HTML_CONTENT_TYPES = (
+    "image/",
+    "video/",
+    "audio/",
+    "font/",
+    "application/pdf",
+    "application/zip",
+    "application/gzip",
+)
+
+
+async def read_text_capped(response: aiohttp.ClientResponse, limit: int = CRAWLER_MAX_BYTES) -> str:
+    # Stream the body in chunks and stop at `limit`, so a huge or endless
+    # response never gets buffered whole. Everything we extract (title, meta,
+    # headings, the first few thousand chars of content) sits well inside it.
+    buf = bytearray()
+    async for chunk in response.content.iter_chunked(_READ_CHUNK_BYTES):
+        buf += chunk
+        if len(buf) >= limit:
+            del buf[limit:]
+            break
+    try:
+        return buf.decode(response.charset or "utf-8", errors="ignore")
+    except LookupError:
+        return buf.decode("utf-8", errors="ignore")
+
+
 def _looks_like_spa_shell(html: str) -> bool:
     if not html:
         return True
@@ -88,12 +148,31 @@ def _is_waf_or_challenge_page(html: str) -> bool:
     )
 
 
+_RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504, 520, 521, 522, 523, 524})
+
+
+_RETRY_BASE_DELAY_S = 0.5
+_RETRY_MAX_DELAY_S = 8.0
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    # Honor a numeric Retry-After (429/503) up to the cap; otherwise exponential
+    # backoff from 0.5s with up to 50% jitter so parallel crawls don't retry in lockstep.
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), _RETRY_MAX_DELAY_S)
+        except ValueError:
+            pass
+    delay = min(_RETRY_BASE_DELAY_S * (2 ** attempt), _RETRY_MAX_DELAY_S)
+    return delay + random.uniform(0, delay / 2)
+
+
 def _should_retry(status: Optional[int], exc: Optional[Exception]) -> bool:
     if exc:
         return isinstance(exc, (aiohttp.ClientError, asyncio.TimeoutError))
     if status is None:
         return True
-    return status in (408, 425, 429, 500, 502, 503, 504, 520, 521, 522, 523, 524)
+    return status in _RETRY_STATUSES
 
 
 async def fetch_url_content(
@@ -102,9 +181,9 @@ async def fetch_url_content(
     max_retries: int = 2,
     proxy: Optional[str] = None,
 ) -> Optional[str]:
-    proxy = proxy or os.getenv("CRAWLER_HTTP_PROXY") or None
-    max_retries = int(os.getenv("CRAWLER_MAX_RETRIES", str(max_retries)))
-    timeout = int(os.getenv("CRAWLER_TIMEOUT_SECONDS", str(timeout)))
+    proxy = proxy or CRAWLER_HTTP_PROXY
+    max_retries = int(CRAWLER_MAX_RETRIES or max_retries)
+    timeout = int(CRAWLER_TIMEOUT_SECONDS or timeout)
 
     client_timeout = aiohttp.ClientTimeout(
         total=timeout,
@@ -127,26 +206,33 @@ async def fetch_url_content(
                     proxy=proxy,
                 ) as response:
                     status = response.status
-                    ctype = (response.headers.get("content-type") or "").lower()
-                    text = await response.text(errors="ignore")
+                    retry_after = response.headers.get("retry-after")
+                    retry = status != 200 and attempt < max_retries and _should_retry(status, None)
+                    if not retry:
+                        ctype = (response.headers.get("content-type") or "").lower()
+                        if ctype.startswith(_NON_HTML_CONTENT_TYPES):
+                            # Decided from headers alone; the body is never downloaded
+                            return None
+                        text = await read_text_capped(response)
+
+                        if status != 200:
+                            return text if ("text/html" in ctype or _sniff_html(text)) else None
 
-                    if status != 200:
-                        if attempt < max_retries and _should_retry(status, None):
-                            await asyncio.sleep(min(2 ** attempt, 8) + random.random())
-                            continue
-                        return text if ("text/html" in ctype or "<html" in (text or "").lower()) else None
+                        if "text/html" not in ctype and not _sniff_html(text):
+                            return None
 
-                    if "text/html" not in ctype and "<html" not in (text or "").lower():
-                        return None
+                        if _is_waf_or_challenge_page(text):
+                            return None
 
-                    if _is_waf_or_challenge_page(text):
-                        return None
+                        return text
 
-                    return text
+                # Retryable status: the error body is never read and the
+                # connection is released before we back off.
+                await asyncio.sleep(_retry_delay(attempt, retry_after))
 
             except Exception as e:
                 if attempt < max_retries and _should_retry(None, e):
-                    await asyncio.sleep(min(2 ** attempt, 8) + random.random())
+                    await asyncio.sleep(_retry_delay(attempt))
                     continue
                 return None
 
@@ -155,7 +241,7 @@ async def render_url_with_js(url: str, timeout: int = 25) -> Optional[str]:
     if not PLAYWRIGHT_AVAILABLE:
         return None
 
-    nav_timeout_ms = int(os.getenv("CRAWLER_JS_TIMEOUT_MS", str(timeout * 1000)))
+    nav_timeout_ms = int(CRAWLER_JS_TIMEOUT_MS or timeout * 1000)
 
     try:
         async with async_playwright() as p:
@@ -223,7 +309,7 @@ def extract_text_content(html: str, url: str = "") -> Dict[str, Any]:
             else:
                 main_content = soup.get_text(separator=" ", strip=True)
 
-        main_content = re.sub(r"\s+", " ", main_content).strip()
+        main_content = _WS_RE.sub(" ", main_content).strip()
 
         headings: List[str] = []
         for heading in soup.find_all(["h1", "h2", "h3"]):
@@ -235,7 +321,7 @@ def extract_text_content(html: str, url: str = "") -> Dict[str, Any]:
         for lst in soup.find_all(["ul", "ol"])[:12]:
             items = lst.find_all("li")
             for item in items[:12]:
-                t = re.sub(r"\s+", " ", item.get_text().strip())
+                t = _WS_RE.sub(" ", item.get_text().strip())
                 if 10 < len(t) < 200 and t not in features:
                     features.append(t)
             if len(features) >= 18:
@@ -330,6 +416,7 @@ def format_crawled_content_for_prompt(crawled_data: Dict[str, Any]) -> str:
     return "\n\n".join(parts)
 
 
+@async_ttl_cache(ttl=CRAWLER_CACHE_TTL_SECONDS, maxsize=128)
 async def crawl_and_extract(
     url: str,
     timeout: int = 12,
@@ -338,7 +425,7 @@ async def crawl_and_extract(
     use_js_render: Optional[bool] = None,
 ) -> Optional[Dict[str, Any]]:
     if use_js_render is None:
-        use_js_render = os.getenv("CRAWLER_ENABLE_JS_RENDER", "false").lower() in ("1", "true", "yes", "y")
+        use_js_render = CRAWLER_ENABLE_JS_RENDER
 
     parsed = urlparse(url)
     if not parsed.scheme:
@@ -350,20 +437,22 @@ async def crawl_and_extract(
         rendered = await render_url_with_js(url, timeout=timeout * 2)
         if not rendered:
             return None
-        extracted = extract_text_content(rendered, url)
+        extracted = await asyncio.to_thread(extract_text_content, rendered, url)
         return extracted if extracted.get("content") else None
 
     if not html:
         return None
 
-    extracted = extract_text_content(html, url)
+    # BeautifulSoup/lxml parsing is CPU-bound (tens of ms on large pages); run it in
+    # a worker thread so concurrent crawls and requests are not stalled.
+    extracted = await asyncio.to_thread(extract_text_content, html, url)
     visible_len = int(extracted.get("debug", {}).get("visible_text_len", 0) or 0)
 
     needs_js = visible_len < 350 or _looks_like_spa_shell(html)
     if use_js_render and needs_js:
         rendered = await render_url_with_js(url, timeout=timeout * 2)
         if rendered:
-            extracted2 = extract_text_content(rendered, url)
+            extracted2 = await asyncio.to_thread(extract_text_content, rendered, url)
             visible_len2 = int(extracted2.get("debug", {}).get("visible_text_len", 0) or 0)
             if visible_len2 > visible_len:
                 return extracted2 if extracted2.get("content") else None
@@ -408,7 +497,7 @@ async def discover_related_sites(
     use_js_render: Optional[bool] = None,
 ) -> List[str]:
     if use_js_render is None:
-        use_js_render = os.getenv("CRAWLER_ENABLE_JS_RENDER", "false").lower() in ("1", "true", "yes", "y")
+        use_js_render = CRAWLER_ENABLE_JS_RENDER
 
     parsed = urlparse(url)
     if not parsed.scheme:
@@ -419,7 +508,7 @@ async def discover_related_sites(
         html = await render_url_with_js(url, timeout=20)
     if not html:
         return []
-    return extract_related_links(html, url, max_links=max_links)
+    return await asyncio.to_thread(extract_related_links, html, url, max_links=max_links)
 
 
 async def crawl_competitors(
@@ -462,11 +551,11 @@ async def _duckduckgo_results(query: str, max_results: int = 20) -> List[str]:
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.5",
     }
-    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=15)) as session:
-        async with session.get(search_url, headers=headers) as resp:
-            if resp.status != 200:
-                return []
-            html = await resp.text(errors="ignore")
+    session = get_http_session()
+    async with session.get(search_url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+        if resp.status != 200:
+            return []
+        html = await read_text_capped(resp)
     soup = BeautifulSoup(html, "lxml")
     links = soup.find_all("a", class_="result__a", href=True)
     urls: List[str] = []
@@ -516,7 +605,7 @@ def extract_keywords_from_content(crawled_data: Dict[str, Any], max_keywords: in
         ]
     ).lower()
 
-    words = re.findall(r"\b[a-z0-9]{4,}\b", text_sources)
+    words = _KEYWORD_TOKEN_RE.findall(text_sources)
     freq: Dict[str, int] = {}
     for w in words:
         if w in stop:
@@ -600,11 +689,11 @@ async def get_google_autocomplete_suggestions(keyword: str) -> List[str]:
         encoded = quote_plus(keyword)
         url = f"https://www.google.com/complete/search?client=firefox&q={encoded}"
         headers = {"User-Agent": random.choice(DEFAULT_USER_AGENTS), "Accept": "application/json"}
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-            async with session.get(url, headers=headers) as resp:
-                if resp.status != 200:
-                    return []
-                data = await resp.json()
+        session = get_http_session()
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+            if resp.status != 200:
+                return []
+            data = orjson.loads(await resp.read())
         if data and len(data) > 1 and isinstance(data[1], list):
             return [str(x) for x in data[1][:10]]
         return []